@@ -4,7 +4,9 @@ import asyncio
 import logging
 import os
 import sys
+import time
 import traceback
+from collections import deque
 
 from blessed import Terminal
 
@@ -15,7 +17,7 @@ from leetshell.api.submissions import SubmissionService
 from leetshell.config import load_config, save_config
 from leetshell.constants import CONFIG_DIR
 from leetshell.models.user import Credentials, UserConfig
-from leetshell.tui.core import Screen, clear_screen, flush
+from leetshell.tui.core import Screen, clear_screen, flush, set_stdout_buffer
 
 # Set up file logger for debugging
 _log_file = CONFIG_DIR / "debug.log"
@@ -26,6 +28,10 @@ _handler = logging.FileHandler(str(_log_file), mode="w", encoding="utf-8")
 _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
 logger.addHandler(_handler)
 
+# LEETSHELL_PROFILE_KEYS=1 times every handle_key() call and logs
+# percentiles on exit
+_PROFILE_KEYS = os.environ.get("LEETSHELL_PROFILE_KEYS") == "1"
+
 
 class LeetCodeApp:
     """Application controller - manages screen stack and event loop."""
@@ -40,6 +46,8 @@ class LeetCodeApp:
                 sys.stdout.reconfigure(encoding="utf-8", errors="replace")
             except Exception:
                 pass
+        # One write syscall per rendered frame instead of many
+        set_stdout_buffer(65536)
         self.term = Terminal()
         self.user_config: UserConfig = UserConfig()
         self.client: LeetCodeClient = LeetCodeClient()
@@ -50,6 +58,10 @@ class LeetCodeApp:
         self._running: bool = False
         self._notification: str = ""
         self._notification_expiry: float = 0
+        # Most recent handle_key() durations in seconds, when profiling
+        self._key_timings: deque[float] | None = (
+            deque(maxlen=4096) if _PROFILE_KEYS else None
+        )
         logger.info("App initialized, terminal %dx%d, is_tty=%s, colors=%d",
                      self.term.width, self.term.height,
                      self.term.is_a_tty, self.term.number_of_colors)
@@ -188,6 +200,16 @@ class LeetCodeApp:
 
         asyncio.create_task(_relogin())
 
+    def _log_key_timings(self) -> None:
+        """Log p50/p95/p99 of the recorded handle_key() durations."""
+        if not self._key_timings:
+            return
+        timings = sorted(self._key_timings)
+        n = len(timings)
+        logger.info("handle_key over %d keys: p50=%.3fms p95=%.3fms p99=%.3fms",
+                     n, timings[n // 2] * 1000, timings[n * 95 // 100] * 1000,
+                     timings[n * 99 // 100] * 1000)
+
     async def run(self) -> None:
         """Main event loop."""
         self._running = True
@@ -233,18 +255,36 @@ class LeetCodeApp:
                     await asyncio.sleep(0.05)
                     continue
 
-                if key:
+                # Keys already waiting (paste, key repeat) are handled
+                # before the next render, so a burst costs a single frame
+                while key and self._running:
+                    screen = self.current_screen
+                    if screen is None:
+                        break
                     logger.debug("key: %r name=%s is_seq=%s",
                                  str(key), key.name, key.is_sequence)
                     try:
-                        await screen.handle_key(key)
+                        if self._key_timings is None:
+                            await screen.handle_key(key)
+                        else:
+                            start = time.perf_counter()
+                            try:
+                                await screen.handle_key(key)
+                            finally:
+                                self._key_timings.append(time.perf_counter() - start)
                     except Exception:
                         logger.error("Key handler error in %s:\n%s",
                                      type(screen).__name__,
                                      traceback.format_exc())
+                    try:
+                        key = t.inkey(timeout=0)
+                    except Exception:
+                        logger.error("inkey error:\n%s", traceback.format_exc())
+                        break
 
         # Cleanup
         logger.info("Event loop ended, cleaning up")
+        self._log_key_timings()
         try:
             await self.client.close()
         except Exception:
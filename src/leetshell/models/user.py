@@ -26,13 +26,20 @@ class Credentials:
 @dataclass
 class Preferences:
     language: str = "python3"
+    use_html2text: bool = False  # fall back to html2text for descriptions
 
     def to_dict(self) -> dict:
-        return {"language": self.language}
+        return {
+            "language": self.language,
+            "use_html2text": self.use_html2text,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Preferences":
-        return cls(language=data.get("language", "python3"))
+        return cls(
+            language=data.get("language", "python3"),
+            use_html2text=bool(data.get("use_html2text", False)),
+        )
 
 
 @dataclass
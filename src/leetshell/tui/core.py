@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import bisect
+import io
 import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,6 +23,7 @@ class Screen:
         self.dirty: bool = True
         self._prev_width: int = 0
         self._prev_height: int = 0
+        self._invalidate_handle = None  # pending schedule_invalidate() timer
 
     def render(self) -> None:
         """Write the screen contents directly to stdout."""
@@ -29,10 +33,36 @@ class Screen:
         """Process a keystroke. key is a blessed Keystroke object."""
         raise NotImplementedError
 
+    async def handle_keys(self, keys) -> None:
+        """Process several keystrokes in order.
+
+        handle_key() only marks the screen dirty, so the whole sequence is
+        drawn by a single render afterwards.
+        """
+        for key in keys:
+            await self.handle_key(key)
+
     def invalidate(self) -> None:
         """Mark this screen as needing a re-render."""
         self.dirty = True
 
+    def schedule_invalidate(self, delay: float = 0.016) -> None:
+        """Invalidate after a short delay, coalescing calls made meanwhile.
+
+        Use for bursts of input (e.g. fast typing) so several keystrokes
+        produce a single render instead of one each.
+        """
+        if self._invalidate_handle is not None:
+            return
+        import asyncio
+
+        def _fire():
+            self._invalidate_handle = None
+            self.invalidate()
+
+        loop = asyncio.get_running_loop()
+        self._invalidate_handle = loop.call_later(delay, _fire)
+
     def check_resize(self) -> bool:
         """Check if terminal size changed (no SIGWINCH on Windows)."""
         w, h = self.term.width, self.term.height
@@ -66,10 +96,27 @@ class Screen:
 
 # ── Terminal helpers ──────────────────────────────────────────────────────
 
+# Cursor-position sequences per (x, y), for the terminal in _move_term
+_move_term: Terminal | None = None
+_moves: dict[tuple[int, int], str] = {}
+
+
+def move(term: Terminal, x: int, y: int) -> str:
+    """Return term.move_xy(x, y), cached per position."""
+    global _move_term
+    if term is not _move_term:
+        _moves.clear()
+        _move_term = term
+    try:
+        return _moves[x, y]
+    except KeyError:
+        seq = _moves[x, y] = term.move_xy(x, y)
+        return seq
+
 
 def write_at(term: Terminal, x: int, y: int, text: str) -> None:
     """Write text at a specific (x, y) position. x=column, y=row."""
-    sys.stdout.write(term.move_xy(x, y) + text)
+    sys.stdout.write(move(term, x, y) + text)
 
 
 def clear_screen(term: Terminal) -> None:
@@ -79,27 +126,33 @@ def clear_screen(term: Terminal) -> None:
 
 def clear_line(term: Terminal, y: int) -> None:
     """Clear a specific line."""
-    sys.stdout.write(term.move_xy(0, y) + term.clear_eol)
+    sys.stdout.write(move(term, 0, y) + term.clear_eol)
 
 
 def draw_hline(term: Terminal, y: int, char: str = "-", width: int = 0) -> None:
     """Draw a horizontal line at row y."""
     w = width or term.width
-    sys.stdout.write(term.move_xy(0, y) + char * w)
+    sys.stdout.write(move(term, 0, y) + char * w)
 
 
 def truncate(text: str, width: int, term: Terminal | None = None) -> str:
     """Truncate PLAIN text to fit within width. Do NOT pass colored text."""
     if width <= 0:
         return ""
-    text_len = len(text)
-    if text_len <= width:
+    if len(text) <= width:
         return text
+    return _ellipsize(text, width)
+
+
+@lru_cache(maxsize=4096)
+def _ellipsize(text: str, width: int) -> str:
+    """Cut text that overflows width, ending in "..." when there is room."""
     if width <= 3:
         return text[:width]
     return text[: width - 3] + "..."
 
 
+@lru_cache(maxsize=4096)
 def pad_right(text: str, width: int) -> str:
     """Pad PLAIN text with spaces to exact width. Do NOT pass colored text."""
     if width <= 0:
@@ -122,11 +175,11 @@ def write_columns(term: Terminal, y: int, cols: list[tuple[int, int, str, str]])
         if color:
             try:
                 fmt = getattr(term, color)
-                sys.stdout.write(term.move_xy(x, y) + fmt(display))
+                sys.stdout.write(move(term, x, y) + fmt(display))
             except (AttributeError, TypeError):
-                sys.stdout.write(term.move_xy(x, y) + display)
+                sys.stdout.write(move(term, x, y) + display)
         else:
-            sys.stdout.write(term.move_xy(x, y) + display)
+            sys.stdout.write(move(term, x, y) + display)
 
 
 def write_row(term: Terminal, y: int, text: str, color: str = "",
@@ -137,11 +190,11 @@ def write_row(term: Terminal, y: int, text: str, color: str = "",
     if color:
         try:
             fmt = getattr(term, color)
-            sys.stdout.write(term.move_xy(0, y) + fmt(text))
+            sys.stdout.write(move(term, 0, y) + fmt(text))
         except (AttributeError, TypeError):
-            sys.stdout.write(term.move_xy(0, y) + text)
+            sys.stdout.write(move(term, 0, y) + text)
     else:
-        sys.stdout.write(term.move_xy(0, y) + text)
+        sys.stdout.write(move(term, 0, y) + text)
 
 
 def fmt(term: Terminal, color: str, text: str) -> str:
@@ -154,6 +207,207 @@ def fmt(term: Terminal, color: str, text: str) -> str:
         return text
 
 
+# (open, close) escape strings per color name, for the terminal in _sgr_term
+_sgr_term: Terminal | None = None
+_sgr_pairs: dict[str, tuple[str, str] | None] = {}
+
+
+def sgr(term: Terminal, color: str) -> tuple[str, str] | None:
+    """Return the cached (open, close) escape strings for a color name.
+
+    Returns None when the attribute is not a plain formatting string
+    (unknown name, or a stand-in terminal object); use fmt() then.
+    """
+    global _sgr_term
+    if term is not _sgr_term:
+        _sgr_pairs.clear()
+        _sgr_term = term
+    try:
+        return _sgr_pairs[color]
+    except KeyError:
+        pass
+    pair = None
+    try:
+        attr = getattr(term, color)
+        if isinstance(attr, str):
+            pair = (str(attr), str(term.normal) if attr else "")
+    except (AttributeError, TypeError):
+        pass
+    _sgr_pairs[color] = pair
+    return pair
+
+
+def paint(term: Terminal, color: str, text: str) -> str:
+    """Like fmt() for PLAIN text, but using cached escape strings."""
+    if not color:
+        return text
+    pair = sgr(term, color)
+    if pair is None:
+        return fmt(term, color, text)
+    return pair[0] + text + pair[1]
+
+
+def paint_cells(term: Terminal, cells: list[tuple[str, str]]) -> str:
+    """Join (color, PLAIN text) cells, emitting SGR only when the color changes.
+
+    Adjacent cells sharing a color get one open sequence, and a single
+    reset is written when leaving a color rather than after every cell.
+    """
+    parts: list[str] = []
+    pen = ""  # color currently active on the wire
+    close = ""
+    for color, text in cells:
+        if color != pen:
+            if pen:
+                parts.append(close)
+                pen = ""
+            if color:
+                pair = sgr(term, color)
+                if pair is None:
+                    parts.append(fmt(term, color, text))
+                    continue
+                parts.append(pair[0])
+                close = pair[1]
+                pen = color
+        parts.append(text)
+    if pen:
+        parts.append(close)
+    return "".join(parts)
+
+
 def flush() -> None:
     """Flush stdout."""
     sys.stdout.flush()
+
+
+_buffered_stdout: io.TextIOWrapper | None = None
+
+
+def set_stdout_buffer(size: int = 65536) -> None:
+    """Replace stdout with a block-buffered writer of the given size.
+
+    Every render path ends with flush(), so output still appears once per
+    frame, but a frame no longer gets split into several write syscalls.
+    Does nothing if stdout has no underlying raw file (e.g. redirected to
+    a StringIO) or was already replaced by an earlier call.
+    """
+    global _buffered_stdout
+    out = sys.stdout
+    if out is _buffered_stdout:
+        # Wrapping again would let the old wrapper close the shared raw file
+        return
+    buffer = getattr(out, "buffer", None)
+    raw = getattr(buffer, "raw", buffer)  # unbuffered stdout exposes FileIO
+    if not isinstance(raw, io.RawIOBase):
+        return
+    out.flush()
+    sys.stdout = _buffered_stdout = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=size),
+        encoding=out.encoding,
+        errors=out.errors,
+        line_buffering=False,
+        write_through=False,
+    )
+
+
+# Begin/end synchronized update (DEC private mode 2026)
+_BSU = "\x1b[?2026h"
+_ESU = "\x1b[?2026l"
+
+
+class LinesView:
+    """Read-only sequence of (color, text) lines built from parts.
+
+    Single lines are stored as given; large text blocks (e.g. error
+    output) are kept as their raw line list and only prefixed when an
+    index is actually read.
+    """
+
+    def __init__(self) -> None:
+        self._starts: list[int] = []  # index of the first line of each part
+        self._parts: list = []  # list of (color, text), or (color, prefix, lines)
+        self._len = 0
+
+    def append(self, line: tuple[str, str]) -> None:
+        if self._parts and isinstance(self._parts[-1], list):
+            self._parts[-1].append(line)
+        else:
+            self._starts.append(self._len)
+            self._parts.append([line])
+        self._len += 1
+
+    def extend_block(self, color: str, prefix: str, lines: list[str]) -> None:
+        """Add lines that will each read back as (color, prefix + line)."""
+        if not lines:
+            return
+        self._starts.append(self._len)
+        self._parts.append((color, prefix, lines))
+        self._len += len(lines)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> tuple[str, str]:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("LinesView index out of range")
+        k = bisect.bisect_right(self._starts, i) - 1
+        part = self._parts[k]
+        j = i - self._starts[k]
+        if isinstance(part, list):
+            return part[j]
+        color, prefix, lines = part
+        return color, prefix + lines[j]
+
+
+class FrameBuffer:
+    """Collects a frame's output so it reaches stdout in a single write.
+
+    The methods mirror the module-level helpers but append to the buffer
+    instead of writing to stdout directly.
+    """
+
+    def __init__(self, shadow: dict[int, str] | None = None) -> None:
+        self._parts: list[str] = []
+        self._shadow = shadow
+
+    def append(self, text: str) -> None:
+        self._parts.append(text)
+
+    def put_row(self, term: Terminal, y: int, line: str) -> None:
+        """Write a complete row, unless the shadow says it is already on screen.
+
+        line must fully describe row y (pad it or include clear_eol). When
+        the buffer was created with a shadow dict, rows whose content is
+        unchanged since the last frame are skipped.
+        """
+        shadow = self._shadow
+        if shadow is not None:
+            if shadow.get(y) == line:
+                return
+            shadow[y] = line
+        self._parts.append(move(term, 0, y) + line)
+
+    def write_at(self, term: Terminal, x: int, y: int, text: str) -> None:
+        self._parts.append(move(term, x, y) + text)
+
+    def clear_line(self, term: Terminal, y: int) -> None:
+        self._parts.append(move(term, 0, y) + term.clear_eol)
+
+    def write_row(self, term: Terminal, y: int, text: str, color: str = "",
+                  fill: bool = False) -> None:
+        if fill:
+            text = pad_right(text, term.width)
+        self._parts.append(move(term, 0, y) + paint(term, color, text))
+
+    def flush(self) -> None:
+        """Write everything collected so far to stdout and flush.
+
+        The frame is wrapped in synchronized-output markers so terminals
+        that support them present it atomically; others ignore them.
+        """
+        if self._parts:
+            sys.stdout.write(_BSU + "".join(self._parts) + _ESU)
+            self._parts.clear()
+        sys.stdout.flush()
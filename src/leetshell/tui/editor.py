@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import re
 import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pygments import lex
@@ -10,7 +13,7 @@ from pygments.token import Token
 if TYPE_CHECKING:
     from blessed import Terminal
 
-from leetshell.tui.core import fmt
+from leetshell.tui.core import fmt, move, paint_cells
 
 # Map Pygments token types to blessed color names
 _TOKEN_COLORS = {
@@ -63,6 +66,7 @@ _TOKEN_COLORS = {
 }
 
 
+@lru_cache(maxsize=None)
 def _get_color(token_type) -> str:
     """Walk up the token hierarchy to find a color."""
     tt = token_type
@@ -73,6 +77,52 @@ def _get_color(token_type) -> str:
     return ""
 
 
+@lru_cache(maxsize=None)
+def _make_lexer(lang_name: str):
+    """Lexer for lang_name, looked up once per language and shared by editors."""
+    try:
+        return get_lexer_by_name(lang_name, stripnl=False, ensurenl=False)
+    except Exception:
+        return TextLexer(stripnl=False, ensurenl=False)
+
+
+_WORD_START_RE = re.compile(r"(?<!\w)\w")
+
+
+@lru_cache(maxsize=256)
+def _word_starts(line: str) -> tuple[int, ...]:
+    """Offsets where a run of word characters (alnum or "_") begins."""
+    return tuple(m.start() for m in _WORD_START_RE.finditer(line))
+
+
+def _sel_contains(sel, row: int, col: int) -> bool:
+    """Check if (row, col) is within sel, a CodeEditor._sel_range() result."""
+    if sel is None:
+        return False
+    (sr, sc), (er, ec) = sel
+    if row < sr or row > er:
+        return False
+    if row == sr and row == er:
+        return sc <= col < ec
+    if row == sr:
+        return col >= sc
+    if row == er:
+        return col < ec
+    return True
+
+
+def _sel_span(sel, row: int) -> tuple[int, int]:
+    """Columns [lo, hi) of row covered by sel; lo == hi when none are."""
+    if sel is None:
+        return 0, 0
+    (sr, sc), (er, ec) = sel
+    if row < sr or row > er:
+        return 0, 0
+    lo = sc if row == sr else 0
+    hi = ec if row == er else sys.maxsize
+    return lo, hi
+
+
 class CodeEditor:
     """Buffer-based code editor with Pygments syntax highlighting.
 
@@ -88,11 +138,18 @@ class CodeEditor:
         self._scroll_row: int = 0
         self._scroll_col: int = 0
         self._lang_name: str = lang_name
-        self._lexer = self._make_lexer(lang_name)
-        self._highlighted: list[list[tuple[str, str]]] = []
+        self._lexer = _make_lexer(lang_name)
+        self._highlighted: list[tuple[tuple[str, str], ...]] = []
         self._highlight_dirty: bool = True
+        self._highlight_src: str | None = None  # text _highlighted was lexed from
         self.dirty: bool = True
         self._gutter_width: int = 4
+        # Row y -> line last written there, for the (term, x, width) in _shadow_rect
+        self._shadow: dict[int, str] = {}
+        self._shadow_rect: tuple | None = None
+        # (tokens, scroll_col, code_width) -> painted code of a plain row last frame
+        self._painted: dict[tuple, str] = {}
+        self._frame_key: tuple | None = None  # everything the last frame depended on
         # Selection: anchor is where Shift+move started; None = no selection
         self._sel_anchor: tuple[int, int] | None = None
         # Undo/redo stacks: each entry is (lines_copy, cursor_row, cursor_col)
@@ -100,17 +157,16 @@ class CodeEditor:
         self._redo_stack: list[tuple[list[str], int, int]] = []
         self._max_undo: int = 200
 
-    @staticmethod
-    def _make_lexer(lang_name: str):
-        try:
-            return get_lexer_by_name(lang_name, stripnl=False, ensurenl=False)
-        except Exception:
-            return TextLexer(stripnl=False, ensurenl=False)
+    def invalidate(self) -> None:
+        """Forget what is on screen so the next render repaints every row."""
+        self._shadow.clear()
+        self.dirty = True
 
     def set_language(self, lang_name: str) -> None:
         self._lang_name = lang_name
-        self._lexer = self._make_lexer(lang_name)
+        self._lexer = _make_lexer(lang_name)
         self._highlight_dirty = True
+        self._highlight_src = None
         self.dirty = True
 
     def set_text(self, text: str) -> None:
@@ -146,19 +202,7 @@ class CodeEditor:
 
     def _in_selection(self, row: int, col: int) -> bool:
         """Check if (row, col) is within the selected range."""
-        sel = self._sel_range()
-        if sel is None:
-            return False
-        (sr, sc), (er, ec) = sel
-        if row < sr or row > er:
-            return False
-        if row == sr and row == er:
-            return sc <= col < ec
-        if row == sr:
-            return col >= sc
-        if row == er:
-            return col < ec
-        return True
+        return _sel_contains(self._sel_range(), row, col)
 
     def _delete_selection(self) -> bool:
         """Delete selected text. Returns True if there was a selection."""
@@ -226,12 +270,19 @@ class CodeEditor:
     # ── Highlighting ──────────────────────────────────────────────────
 
     def _rehighlight(self) -> None:
-        """Re-lex the entire text and cache per-line token lists."""
+        """Re-lex the entire text and cache per-line token lists.
+
+        Lexing is skipped when the text is unchanged since the last pass,
+        e.g. after an edit is undone or a line is restored.
+        """
         if not self._highlight_dirty:
             return
         self._highlight_dirty = False
 
         full_text = "\n".join(self._lines)
+        if full_text == self._highlight_src:
+            return
+        self._highlight_src = full_text
         tokens = list(lex(full_text, self._lexer))
 
         # Split tokens at newline boundaries into per-line lists
@@ -243,23 +294,27 @@ class CodeEditor:
             parts = value.split("\n")
             for i, part in enumerate(parts):
                 if i > 0:
-                    self._highlighted.append(current_line)
+                    self._highlighted.append(tuple(current_line))
                     current_line = []
                 if part:
                     current_line.append((color, part))
 
-        self._highlighted.append(current_line)
+        self._highlighted.append(tuple(current_line))
 
         # Pad to match _lines count
         while len(self._highlighted) < len(self._lines):
-            self._highlighted.append([])
+            self._highlighted.append(())
 
     # ── Rendering ─────────────────────────────────────────────────────
 
-    def render(self, x: int, y: int, width: int, height: int) -> None:
-        """Render the editor within the given rectangle."""
+    def render(self, x: int, y: int, width: int, height: int, *, file=None) -> None:
+        """Render the editor within the given rectangle.
+
+        Output goes to file, or to sys.stdout when it is None.
+        """
         t = self.term
         self._rehighlight()
+        sel = self._sel_range()  # fixed for the whole frame
 
         self._gutter_width = max(4, len(str(len(self._lines))) + 2)
         code_width = width - self._gutter_width
@@ -275,17 +330,42 @@ class CodeEditor:
         elif self._cursor_col >= self._scroll_col + code_width:
             self._scroll_col = self._cursor_col - code_width + 1
 
+        if self._shadow_rect != (t, x, width):
+            self._shadow.clear()
+            self._painted.clear()
+            self._shadow_rect = (t, x, width)
+        shadow = self._shadow
+
+        # Nothing changed since a frame that is still on screen: skip it
+        frame_key = (
+            y, height, self._lexer, self._highlight_src,
+            self._cursor_row, self._cursor_col,
+            self._scroll_row, self._scroll_col, self._sel_anchor,
+        )
+        if shadow and frame_key == self._frame_key:
+            self.dirty = False
+            return
+        self._frame_key = frame_key
+
+        # Rows without cursor or selection repaint identically whenever their
+        # tokens do, so their code is reused from the previous frame
+        last_painted = self._painted
+        painted: dict[tuple, str] = {}
+        out: list[str] = []  # changed rows, written to stdout in one call
+        empty_row: str | None = None  # rows past the end are all alike
+
         for i in range(height):
             line_idx = self._scroll_row + i
             row_y = y + i
 
             if line_idx >= len(self._lines):
                 # Empty line below content
-                sys.stdout.write(
-                    t.move_xy(x, row_y)
-                    + fmt(t, "dim", " " * self._gutter_width)
-                    + " " * code_width
-                )
+                if empty_row is None:
+                    empty_row = fmt(t, "dim", " " * self._gutter_width) + " " * code_width
+                line = empty_row
+                if shadow.get(row_y) != line:
+                    shadow[row_y] = line
+                    out.append(move(t, x, row_y) + line)
                 continue
 
             # Gutter (line number)
@@ -295,61 +375,78 @@ class CodeEditor:
             else:
                 gutter = fmt(t, "dim", line_num)
 
-            sys.stdout.write(t.move_xy(x, row_y) + gutter)
-
             # Code content with syntax highlighting
             if line_idx < len(self._highlighted):
                 tokens = self._highlighted[line_idx]
             else:
-                tokens = []
+                tokens = ()
 
-            # Build the visible portion of the line
-            col = 0
-            output_col = 0
-            for color, text in tokens:
-                for ch in text:
-                    if col >= self._scroll_col and output_col < code_width:
-                        is_cursor = (
-                            line_idx == self._cursor_row
-                            and col == self._cursor_col
-                        )
-                        in_sel = self._in_selection(line_idx, col)
-                        if is_cursor:
-                            sys.stdout.write(fmt(t, "reverse", ch))
-                        elif in_sel:
-                            sys.stdout.write(fmt(t, "reverse", ch))
-                        elif color:
-                            sys.stdout.write(fmt(t, color, ch))
-                        else:
-                            sys.stdout.write(ch)
-                        output_col += 1
-                    col += 1
-
-            # Draw cursor if it's past end of line content
-            if (
-                line_idx == self._cursor_row
-                and self._cursor_col >= col
-                and self._cursor_col - self._scroll_col < code_width
-            ):
-                padding = self._cursor_col - col
-                if padding > 0 and output_col < code_width:
-                    spaces = min(padding, code_width - output_col)
-                    sys.stdout.write(" " * spaces)
-                    output_col += spaces
-                if output_col < code_width:
-                    sys.stdout.write(fmt(t, "reverse", " "))
-                    output_col += 1
+            sel_lo, sel_hi = _sel_span(sel, line_idx)
+            if line_idx == self._cursor_row or sel_lo < sel_hi:
+                code = self._paint_code(tokens, line_idx, sel_lo, sel_hi, code_width)
+            else:
+                key = (tokens, self._scroll_col, code_width)
+                code = last_painted.get(key)
+                if code is None:
+                    code = self._paint_code(tokens, line_idx, 0, 0, code_width)
+                painted[key] = code
+
+            # Skip rows that already show exactly this content
+            line = gutter + code
+            if shadow.get(row_y) != line:
+                shadow[row_y] = line
+                out.append(move(t, x, row_y) + line)
+
+        if out:
+            (sys.stdout if file is None else file).write("".join(out))
+        self._painted = painted
+        self.dirty = False
 
-            # Clear rest of line - highlight trailing space if in selection
-            remaining = code_width - output_col
-            if remaining > 0:
-                line_len = len(self._lines[line_idx]) if line_idx < len(self._lines) else 0
-                if self._in_selection(line_idx, line_len):
-                    sys.stdout.write(fmt(t, "reverse", " " * remaining))
-                else:
-                    sys.stdout.write(" " * remaining)
+    def _paint_code(self, tokens: tuple[tuple[str, str], ...], line_idx: int,
+                    sel_lo: int, sel_hi: int, code_width: int) -> str:
+        """Colored visible code of one line, padded to code_width."""
+        cells: list[tuple[str, str]] = []
+        col = 0
+        output_col = 0
+        for color, text in tokens:
+            for ch in text:
+                if col >= self._scroll_col and output_col < code_width:
+                    is_cursor = (
+                        line_idx == self._cursor_row
+                        and col == self._cursor_col
+                    )
+                    if is_cursor or sel_lo <= col < sel_hi:
+                        cells.append(("reverse", ch))
+                    else:
+                        cells.append((color, ch))
+                    output_col += 1
+                col += 1
 
-        self.dirty = False
+        # Draw cursor if it's past end of line content
+        if (
+            line_idx == self._cursor_row
+            and self._cursor_col >= col
+            and self._cursor_col - self._scroll_col < code_width
+        ):
+            padding = self._cursor_col - col
+            if padding > 0 and output_col < code_width:
+                spaces = min(padding, code_width - output_col)
+                cells.append(("", " " * spaces))
+                output_col += spaces
+            if output_col < code_width:
+                cells.append(("reverse", " "))
+                output_col += 1
+
+        # Clear rest of line - highlight trailing space if in selection
+        remaining = code_width - output_col
+        if remaining > 0:
+            line_len = len(self._lines[line_idx]) if line_idx < len(self._lines) else 0
+            if sel_lo <= line_len < sel_hi:
+                cells.append(("reverse", " " * remaining))
+            else:
+                cells.append(("", " " * remaining))
+        # One SGR open/close per run of same-colored cells, from cached strings
+        return paint_cells(self.term, cells)
 
     # ── Editing operations ────────────────────────────────────────────
 
@@ -364,13 +461,13 @@ class CodeEditor:
             if self._sel_anchor is None:
                 self._sel_anchor = (self._cursor_row, self._cursor_col)
             if name in ("kUP2", "kUP6"):
-                self._move_up()
+                self._move_cursor(-1, 0, select=True)
             elif name in ("kDN2", "kDN6"):
-                self._move_down()
+                self._move_cursor(1, 0, select=True)
             elif name == "kLFT2":
-                self._move_left()
+                self._move_cursor(0, -1, select=True)
             elif name == "kRIT2":
-                self._move_right()
+                self._move_cursor(0, 1, select=True)
             elif name == "kLFT6":
                 self._move_word_left()
             elif name == "kRIT6":
@@ -395,12 +492,10 @@ class CodeEditor:
 
         # ── Regular cursor movement (clears selection) ───────────────
         if name == "KEY_UP":
-            self._sel_anchor = None
-            self._move_up()
+            self._move_cursor(-1, 0)
             return True
         if name == "KEY_DOWN":
-            self._sel_anchor = None
-            self._move_down()
+            self._move_cursor(1, 0)
             return True
         if name == "KEY_LEFT":
             if self._sel_anchor is not None:
@@ -410,7 +505,7 @@ class CodeEditor:
                 self._sel_anchor = None
                 self.dirty = True
                 return True
-            self._move_left()
+            self._move_cursor(0, -1)
             return True
         if name == "KEY_RIGHT":
             if self._sel_anchor is not None:
@@ -420,7 +515,7 @@ class CodeEditor:
                 self._sel_anchor = None
                 self.dirty = True
                 return True
-            self._move_right()
+            self._move_cursor(0, 1)
             return True
         if name == "KEY_HOME":
             self._sel_anchor = None
@@ -538,12 +633,7 @@ class CodeEditor:
     def _enter(self) -> None:
         line = self._lines[self._cursor_row]
         # Auto-indent: copy leading whitespace from current line
-        indent = ""
-        for ch in line:
-            if ch in (" ", "\t"):
-                indent += ch
-            else:
-                break
+        indent = line[: len(line) - len(line.lstrip(" \t"))]
         before = line[: self._cursor_col]
         after = line[self._cursor_col :]
         self._lines[self._cursor_row] = before
@@ -553,48 +643,58 @@ class CodeEditor:
         self._highlight_dirty = True
         self.dirty = True
 
-    def _move_up(self) -> None:
-        if self._cursor_row > 0:
-            self._cursor_row -= 1
-            self._cursor_col = min(self._cursor_col, len(self._lines[self._cursor_row]))
-            self.dirty = True
+    def _move_cursor(self, drow: int, dcol: int, select: bool = False) -> None:
+        """Move the cursor drow lines, then dcol characters.
 
-    def _move_down(self) -> None:
-        if self._cursor_row < len(self._lines) - 1:
-            self._cursor_row += 1
-            self._cursor_col = min(self._cursor_col, len(self._lines[self._cursor_row]))
+        Vertical moves clamp the column to the new line; horizontal moves
+        wrap across line ends like repeated Left/Right. With select the
+        selection is extended from its anchor, otherwise it is cleared.
+        """
+        if select:
+            if self._sel_anchor is None:
+                self._sel_anchor = (self._cursor_row, self._cursor_col)
+        elif self._sel_anchor is not None:
+            self._sel_anchor = None
             self.dirty = True
 
-    def _move_left(self) -> None:
-        if self._cursor_col > 0:
-            self._cursor_col -= 1
-            self.dirty = True
-        elif self._cursor_row > 0:
-            self._cursor_row -= 1
-            self._cursor_col = len(self._lines[self._cursor_row])
-            self.dirty = True
+        lines = self._lines
+        row, col = self._cursor_row, self._cursor_col
+        if drow:
+            row = max(0, min(len(lines) - 1, row + drow))
+            if row != self._cursor_row:
+                col = min(col, len(lines[row]))
+        while dcol > 0:
+            room = len(lines[row]) - col
+            if dcol <= room:
+                col += dcol
+                break
+            if row == len(lines) - 1:
+                col = len(lines[row])
+                break
+            dcol -= room + 1
+            row += 1
+            col = 0
+        while dcol < 0:
+            if -dcol <= col:
+                col += dcol
+                break
+            if row == 0:
+                col = 0
+                break
+            dcol += col + 1
+            row -= 1
+            col = len(lines[row])
 
-    def _move_right(self) -> None:
-        line = self._lines[self._cursor_row]
-        if self._cursor_col < len(line):
-            self._cursor_col += 1
-            self.dirty = True
-        elif self._cursor_row < len(self._lines) - 1:
-            self._cursor_row += 1
-            self._cursor_col = 0
+        if (row, col) != (self._cursor_row, self._cursor_col):
+            self._cursor_row, self._cursor_col = row, col
             self.dirty = True
 
     def _move_word_left(self) -> None:
         if self._cursor_col > 0:
-            line = self._lines[self._cursor_row]
-            col = self._cursor_col - 1
-            # Skip non-word chars
-            while col > 0 and not (line[col].isalnum() or line[col] == "_"):
-                col -= 1
-            # Skip word chars
-            while col > 0 and (line[col - 1].isalnum() or line[col - 1] == "_"):
-                col -= 1
-            self._cursor_col = col
+            # Start of the word at or before the cursor
+            starts = _word_starts(self._lines[self._cursor_row])
+            i = bisect_left(starts, self._cursor_col) - 1
+            self._cursor_col = starts[i] if i >= 0 else 0
         elif self._cursor_row > 0:
             self._cursor_row -= 1
             self._cursor_col = len(self._lines[self._cursor_row])
@@ -603,14 +703,10 @@ class CodeEditor:
     def _move_word_right(self) -> None:
         line = self._lines[self._cursor_row]
         if self._cursor_col < len(line):
-            col = self._cursor_col
-            # Skip word chars
-            while col < len(line) and (line[col].isalnum() or line[col] == "_"):
-                col += 1
-            # Skip non-word chars
-            while col < len(line) and not (line[col].isalnum() or line[col] == "_"):
-                col += 1
-            self._cursor_col = col
+            # Start of the next word, or end of line
+            starts = _word_starts(line)
+            i = bisect_right(starts, self._cursor_col)
+            self._cursor_col = starts[i] if i < len(starts) else len(line)
         elif self._cursor_row < len(self._lines) - 1:
             self._cursor_row += 1
             self._cursor_col = 0
@@ -0,0 +1,188 @@
+"""Plain-text renderer for LeetCode problem HTML.
+
+LeetCode descriptions only use a small, fixed set of tags (p, code, pre,
+ul/ol/li, strong/em, sup/sub, table, img), so a direct HTMLParser walk is much
+cheaper than a general HTML-to-markdown converter.
+"""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+
+_WS_RE = re.compile(r"\s+")
+
+_BLOCK_TAGS = frozenset({
+    "p", "div", "section", "blockquote", "table",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+})
+
+
+def _wrap(text: str, width: int, first: str, rest: str) -> list[str]:
+    """Greedy word-wrap with separate first-line and continuation prefixes."""
+    out: list[str] = []
+    line = first
+    empty = True
+    for word in text.split(" "):
+        if not word:
+            continue
+        if empty:
+            line += word
+            empty = False
+        elif len(line) + 1 + len(word) <= width:
+            line += " " + word
+        else:
+            out.append(line)
+            line = rest + word
+    if not empty:
+        out.append(line)
+    return out
+
+
+class _LeetCodeParser(HTMLParser):
+    def __init__(self, width: int) -> None:
+        super().__init__(convert_charrefs=True)
+        self.width = width
+        self.lines: list[str] = []
+        self._buf: list[str] = []
+        self._pre_depth = 0
+        self._lists: list[list] = []  # [tag, counter] per open ul/ol
+        self._item_prefix: str | None = None
+        self._cells = 0  # td/th cells opened in the current table row
+
+    # ── Output helpers ────────────────────────────────────────────
+
+    def _blank(self) -> None:
+        if self.lines and self.lines[-1]:
+            self.lines.append("")
+
+    def _flush_inline(self) -> None:
+        """Wrap buffered inline text into lines."""
+        text = _WS_RE.sub(" ", "".join(self._buf)).strip()
+        self._buf.clear()
+        indent = "  " * max(0, len(self._lists) - 1)
+        if self._item_prefix is not None:
+            first = indent + self._item_prefix
+            self._item_prefix = None
+            rest = " " * len(first)
+            if not text:
+                self.lines.append(first.rstrip())
+                return
+        elif not text:
+            return
+        else:
+            first = rest = indent + ("  " if self._lists else "")
+        self.lines.extend(_wrap(text, self.width, first, rest))
+
+    def _flush_pre(self) -> None:
+        text = "".join(self._buf).replace("\xa0", " ")
+        self._buf.clear()
+        pre_lines = [ln.rstrip() for ln in text.split("\n")]
+        while pre_lines and not pre_lines[0]:
+            pre_lines.pop(0)
+        while pre_lines and not pre_lines[-1]:
+            pre_lines.pop()
+        self._blank()
+        self.lines.extend("    " + ln if ln else "" for ln in pre_lines)
+        self._blank()
+
+    # ── Parser callbacks ──────────────────────────────────────────
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if self._pre_depth:
+            if tag == "pre":
+                self._pre_depth += 1
+            return
+        if tag == "pre":
+            self._flush_inline()
+            self._pre_depth = 1
+        elif tag in _BLOCK_TAGS:
+            # An empty buffer keeps a pending list bullet for the block's text
+            if "".join(self._buf).strip():
+                self._flush_inline()
+            if not self._lists:
+                self._blank()
+        elif tag == "tr":
+            self._flush_inline()
+            self._cells = 0
+        elif tag in ("td", "th"):
+            if self._cells:
+                self._buf.append(" | ")
+            self._cells += 1
+        elif tag in ("ul", "ol"):
+            self._flush_inline()
+            if not self._lists:
+                self._blank()
+            self._lists.append([tag, 0])
+        elif tag == "li":
+            self._flush_inline()
+            if self._lists:
+                kind = self._lists[-1]
+                kind[1] += 1
+                self._item_prefix = f"{kind[1]}. " if kind[0] == "ol" else "- "
+            else:
+                self._item_prefix = "- "
+        elif tag == "br":
+            self._flush_inline()
+        elif tag == "code":
+            self._buf.append("`")
+        elif tag == "sup":
+            self._buf.append("^")
+        elif tag == "sub":
+            self._buf.append("_")
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._pre_depth:
+            if tag == "pre":
+                self._pre_depth -= 1
+                if not self._pre_depth:
+                    self._flush_pre()
+            return
+        if tag in _BLOCK_TAGS or tag == "li":
+            self._flush_inline()
+            if not self._lists:
+                self._blank()
+        elif tag == "tr":
+            self._flush_inline()
+        elif tag in ("ul", "ol"):
+            self._flush_inline()
+            if self._lists:
+                self._lists.pop()
+            if not self._lists:
+                self._blank()
+        elif tag == "code":
+            self._buf.append("`")
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        if tag == "br" and not self._pre_depth:
+            self._flush_inline()
+
+    def handle_data(self, data: str) -> None:
+        if self._pre_depth:
+            self._buf.append(data)
+        else:
+            self._buf.append(data.replace("\xa0", " "))
+
+    def close(self) -> None:
+        super().close()
+        if self._pre_depth:
+            self._pre_depth = 0
+            self._flush_pre()
+        else:
+            self._flush_inline()
+        while self.lines and not self.lines[-1]:
+            self.lines.pop()
+
+
+def to_plaintext(html: str, width: int) -> list[str]:
+    """Render LeetCode problem HTML as lines no wider than width.
+
+    Inline code keeps its backticks, <sup> becomes "^" and <sub> "_",
+    table cells are joined with " | " one row per line, list items are
+    prefixed with "- " (or "N. " for ordered lists), <pre> blocks keep
+    their own line breaks with a four-space indent, and images are dropped.
+    """
+    parser = _LeetCodeParser(max(1, width))
+    parser.feed(html)
+    parser.close()
+    return parser.lines
@@ -16,7 +16,7 @@ from leetshell.browser_cookies import (
 )
 from leetshell.models.user import Credentials
 from leetshell.tui.core import (
-    Screen, write_at, clear_screen, clear_line, pad_right, write_row, fmt, flush,
+    Screen, write_at, clear_screen, clear_line, pad_right, write_row, fmt, flush, move,
 )
 
 
@@ -154,7 +154,7 @@ class LoginScreen(Screen):
                 if i == self._cursor:
                     text = f"  > {option}"
                     sys.stdout.write(
-                        t.move_xy(2, row) + fmt(t, "reverse", pad_right(text, w - 4))
+                        move(t, 2, row) + fmt(t, "reverse", pad_right(text, w - 4))
                     )
                 else:
                     write_at(t, 2, row, f"    {option}")
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import re
 import sys
-import html2text
+from typing import TYPE_CHECKING, Callable, Sequence
 
 from leetshell.api.client import AuthenticationError
 from leetshell.config import save_config
@@ -12,17 +13,28 @@ from leetshell.editor import get_solution_path
 from leetshell.models.problem import ProblemDetail
 from leetshell.tui.core import (
     Screen, write_at, clear_screen, clear_line, pad_right, truncate,
-    write_row, fmt, flush,
+    write_row, fmt, flush, move,
 )
 from leetshell.tui.editor import CodeEditor
+from leetshell.tui.leetcode_html import to_plaintext
 
-# Shared html2text converter
+if TYPE_CHECKING:
+    import html2text
+
+_DIFF_COLOR = {"Easy": "green", "Medium": "yellow", "Hard": "red"}
+_STATUS_DESC = "^d split view  arrows scroll  esc back"
+_STATUS_SPLIT = "^t test  ^s submit  ^l lang  ^d editor  ^u/^r undo/redo  c-up/dn scroll  esc back"
+_STATUS_EDITOR = "^t test  ^s submit  ^l lang  ^d description  ^u/^r undo/redo  esc back"
+
+# Shared html2text converter (only used when preferences.use_html2text is set)
 _h2t_instance: html2text.HTML2Text | None = None
 
 
 def _get_h2t() -> html2text.HTML2Text:
     global _h2t_instance
     if _h2t_instance is None:
+        import html2text  # deferred: only the opt-in fallback path needs it
+
         _h2t_instance = html2text.HTML2Text()
         _h2t_instance.ignore_links = False
         _h2t_instance.ignore_images = True
@@ -30,25 +42,49 @@ def _get_h2t() -> html2text.HTML2Text:
     return _h2t_instance
 
 
+# Built descriptions keyed by (content key, terminal width, use_html2text)
+_DESC_CACHE_SIZE = 32
+# Values are [raw_lines, boxed_lines]; boxed is None until first formatted
+_desc_cache: dict[tuple[bytes, int, bool], list[tuple[str, ...] | None]] = {}
+
+
+def _content_key(body: str) -> bytes:
+    """Short stable digest of a text body, for use as a cache key."""
+    return hashlib.blake2b(
+        body.encode("utf-8", "surrogatepass"), digest_size=8
+    ).digest()
+
+
 # ── Box-drawing description formatter ─────────────────────────────
 
 
-def _wrap_for_box(text: str, max_w: int) -> list[str]:
-    """Word-wrap a single line to fit within max_w chars."""
-    if len(text) <= max_w:
-        return [text]
-    indent = len(text) - len(text.lstrip())
-    prefix = text[:indent]
-    result: list[str] = []
-    rest = text
+def _wrap_one(line: str, max_w: int, out: list[str]) -> None:
+    """Word-wrap a single line to max_w chars, appending segments to out.
+
+    Continuation segments keep the line's leading indent; a word longer
+    than the available width is hard-cut.
+    """
+    if len(line) <= max_w:
+        out.append(line)
+        return
+    indent = len(line) - len(line.lstrip())
+    prefix = line[:indent]
+    rest = line
     while len(rest) > max_w:
-        cut = rest.rfind(" ", 0, max_w)
+        # Find last space before max_w
+        cut = rest.rfind(" ", indent, max_w)
         if cut <= indent:
-            cut = max_w
-        result.append(rest[:cut])
+            cut = max_w  # no space found, hard cut
+        out.append(rest[:cut])
         rest = prefix + rest[cut:].lstrip()
     if rest:
-        result.append(rest)
+        out.append(rest)
+
+
+def _wrap_for_box(text: str, max_w: int) -> list[str]:
+    """Word-wrap a single line to fit within max_w chars."""
+    result: list[str] = []
+    _wrap_one(text, max_w, result)
     return result
 
 
@@ -145,24 +181,11 @@ def _format_with_boxes(lines: list[str], box_w: int) -> list[str]:
     return result
 
 
-def _rewrap_lines(lines: list[str], max_w: int) -> list[str]:
+def _rewrap_lines(lines: Sequence[str], max_w: int) -> list[str]:
     """Re-wrap lines to fit within max_w, preserving indentation."""
     result: list[str] = []
     for line in lines:
-        if len(line) <= max_w:
-            result.append(line)
-        else:
-            indent = len(line) - len(line.lstrip())
-            prefix = line[:indent]
-            rest = line
-            while len(rest) > max_w:
-                cut = rest.rfind(" ", indent, max_w)
-                if cut <= indent:
-                    cut = max_w
-                result.append(rest[:cut])
-                rest = prefix + rest[cut:].lstrip()
-            if rest:
-                result.append(rest)
+        _wrap_one(line, max_w, result)
     return result
 
 
@@ -176,12 +199,61 @@ class ProblemDetailScreen(Screen):
         self._view_mode: str = "split"  # "desc" | "split" | "editor"
         self._dirty = False
         self._loading = True
+        self._loaded = asyncio.Event()  # set when the fetch finishes, either way
         self._editor: CodeEditor | None = None
+        self._code_cache: dict[str, str] = {}  # lang_slug -> solution text
 
-        # Description
-        self._desc_lines: list[str] = []      # formatted with boxes (full-screen desc)
-        self._desc_lines_raw: list[str] = []   # plain cleaned lines (split view)
+        # Description - built once per terminal width, never mutated in place
+        self._desc_lines_raw: tuple[str, ...] = ()  # plain cleaned lines (split view)
+        self._desc_boxed: tuple[str, ...] | None = None  # built on first desc-view use
+        self._desc_entry: list[tuple[str, ...] | None] | None = None  # this description's _desc_cache entry
+        self._desc_render_width: int = 0
         self._desc_scroll: int = 0
+        # Split-pane re-wrap of _desc_lines_raw, reused while both are unchanged
+        self._split_lines: list[str] = []
+        self._split_src: tuple[str, ...] | None = None
+        self._split_w: int = 0
+
+        # Which split-view panes need repainting on the next render
+        self._dirty_desc: bool = True
+        self._dirty_editor: bool = True
+
+        # Description-scroll bindings per view mode, keyed by key.name.
+        # Split-view keys not listed here go to the editor.
+        self._scroll_keys: dict[str, dict[str, Callable[[], None]]] = {
+            "desc": {
+                "kUP5": self._desc_line_up, "kUP3": self._desc_line_up,
+                "KEY_UP": self._desc_line_up,
+                "kDN5": self._desc_line_down, "kDN3": self._desc_line_down,
+                "KEY_DOWN": self._desc_line_down,
+                "KEY_PGUP": self._desc_page_up,
+                "KEY_PGDOWN": self._desc_page_down,
+            },
+            "split": {
+                "kUP5": self._split_line_up, "kUP3": self._split_line_up,
+                "kDN5": self._split_line_down, "kDN3": self._split_line_down,
+                "KEY_PGUP": self._split_page_up,
+                "KEY_PGDOWN": self._split_page_down,
+            },
+            "editor": {},
+        }
+
+    def invalidate(self) -> None:
+        self._dirty_desc = True
+        self._dirty_editor = True
+        if self._editor:
+            self._editor.invalidate()
+        super().invalidate()
+
+    def _invalidate_desc(self) -> None:
+        """Mark only the description pane as needing a repaint."""
+        self._dirty_desc = True
+        self.dirty = True
+
+    def _invalidate_editor(self) -> None:
+        """Mark only the editor pane as needing a repaint."""
+        self._dirty_editor = True
+        self.dirty = True
 
     async def on_enter(self) -> None:
         self.invalidate()
@@ -197,63 +269,7 @@ class ProblemDetailScreen(Screen):
             )
             self._detail = detail
 
-            if detail.paid_only and not detail.content:
-                self._loading = False
-                self._desc_lines = ["Premium problem. Content not available."]
-                self._desc_lines_raw = list(self._desc_lines)
-                self.invalidate()
-                return
-
-            # Parse description - wrap at terminal width for proper display
-            h2t = _get_h2t()
-            h2t.body_width = max(40, self.term.width - 4)
-            content = detail.content or ""
-            # Convert <sup> to ^ for readable exponents (e.g. 2^31)
-            content = re.sub(r"<sup>(\w+)</sup>", r"^\1", content)
-            md_text = h2t.handle(content) if content else "No content."
-            # Strip markdown bold markers for clean terminal display
-            md_text = md_text.replace("**", "")
-            # Collapse consecutive blank lines and strip trailing whitespace
-            raw_lines = md_text.split("\n")
-            cleaned: list[str] = []
-            prev_blank = False
-            for line in raw_lines:
-                stripped = line.rstrip()
-                is_blank = not stripped
-                if is_blank and prev_blank:
-                    continue  # skip consecutive blank lines
-                cleaned.append(stripped)
-                prev_blank = is_blank
-            # Remove leading/trailing blank lines
-            while cleaned and not cleaned[0]:
-                cleaned.pop(0)
-            while cleaned and not cleaned[-1]:
-                cleaned.pop()
-            # Hard-wrap any remaining long lines (indented code/list items)
-            max_w = max(40, self.term.width - 4)
-            wrapped: list[str] = []
-            for line in cleaned:
-                if len(line) <= max_w:
-                    wrapped.append(line)
-                else:
-                    # Preserve leading indent when wrapping
-                    indent = len(line) - len(line.lstrip())
-                    prefix = line[:indent]
-                    rest = line
-                    while len(rest) > max_w:
-                        # Find last space before max_w
-                        cut = rest.rfind(" ", indent, max_w)
-                        if cut <= indent:
-                            cut = max_w  # no space found, hard cut
-                        wrapped.append(rest[:cut])
-                        rest = prefix + rest[cut:].lstrip()
-                    if rest:
-                        wrapped.append(rest)
-            # Save raw lines for split view (before box formatting)
-            self._desc_lines_raw = list(wrapped)
-            # Format with box-drawing borders for examples & constraints
-            avail_w = max(40, self.term.width - 2)
-            self._desc_lines = _format_with_boxes(wrapped, avail_w)
+            self._build_description()
 
             # Set language
             self._lang_slug = self.app.user_config.preferences.language
@@ -266,7 +282,7 @@ class ProblemDetailScreen(Screen):
                     self._lang_slug = slugs[0]
 
             # Load code and create editor
-            code = self._load_code()
+            code = await asyncio.to_thread(self._load_code)
             pygments_lang = LANG_SLUG_TO_PYGMENTS.get(self._lang_slug, "text")
             self._editor = CodeEditor(self.term, pygments_lang)
             self._editor.set_text(code)
@@ -281,21 +297,145 @@ class ProblemDetailScreen(Screen):
             self._loading = False
             self.app.notify(f"Error: {e}")
             self.invalidate()
+        finally:
+            self._loaded.set()
+
+    def _build_description(self) -> None:
+        """Convert the problem HTML into wrapped description lines.
+
+        Only called on the initial fetch and from _on_resize when the
+        width changed; language switches and redraws reuse the result.
+        """
+        detail = self._detail
+        if detail is None:
+            return
+        self._desc_render_width = self.term.width
+
+        if detail.paid_only and not detail.content:
+            self._desc_lines_raw = ("Premium problem. Content not available.",)
+            self._desc_boxed = self._desc_lines_raw
+            self._desc_entry = None
+            return
+
+        content = detail.content or ""
+        use_h2t = self.app.user_config.preferences.use_html2text
+        cache_key = (_content_key(content), self.term.width, use_h2t)
+        cached = _desc_cache.get(cache_key)
+        if cached is not None:
+            self._desc_lines_raw, self._desc_boxed = cached
+            self._desc_entry = cached
+            return
+
+        # Parse description - wrap at terminal width for proper display
+        body_w = max(40, self.term.width - 4)
+        if not content:
+            raw_lines = ["No content."]
+        elif use_h2t:
+            h2t = _get_h2t()
+            h2t.body_width = body_w
+            # Convert <sup> to ^ for readable exponents (e.g. 2^31)
+            content = re.sub(r"<sup>(\w+)</sup>", r"^\1", content)
+            md_text = h2t.handle(content)
+            # Strip markdown bold markers for clean terminal display
+            md_text = md_text.replace("**", "")
+            raw_lines = md_text.split("\n")
+        else:
+            raw_lines = to_plaintext(content, body_w)
+        # Collapse consecutive blank lines and strip trailing whitespace
+        cleaned: list[str] = []
+        prev_blank = False
+        for line in raw_lines:
+            stripped = line.rstrip()
+            is_blank = not stripped
+            if is_blank and prev_blank:
+                continue  # skip consecutive blank lines
+            cleaned.append(stripped)
+            prev_blank = is_blank
+        # Remove leading/trailing blank lines
+        while cleaned and not cleaned[0]:
+            cleaned.pop(0)
+        while cleaned and not cleaned[-1]:
+            cleaned.pop()
+        # Hard-wrap any remaining long lines (indented code/list items)
+        wrapped = _rewrap_lines(cleaned, body_w)
+        # Save raw lines for split view; boxes are added lazily
+        self._desc_lines_raw = tuple(wrapped)
+        self._desc_boxed = None
+
+        if len(_desc_cache) >= _DESC_CACHE_SIZE:
+            del _desc_cache[next(iter(_desc_cache))]  # drop oldest entry
+        self._desc_entry = [self._desc_lines_raw, None]
+        _desc_cache[cache_key] = self._desc_entry
+
+    def _split_desc_lines(self, desc_text_w: int) -> list[str]:
+        """Return the description re-wrapped for the split pane's width."""
+        if self._split_src is not self._desc_lines_raw or self._split_w != desc_text_w:
+            self._split_lines = _rewrap_lines(self._desc_lines_raw, desc_text_w)
+            self._split_src = self._desc_lines_raw
+            self._split_w = desc_text_w
+        return self._split_lines
+
+    def _ensure_desc_lines(self) -> tuple[str, ...]:
+        """Return the boxed description lines, formatting them on first use."""
+        if self._desc_boxed is None:
+            # Format with box-drawing borders for examples & constraints
+            avail_w = max(40, self._desc_render_width - 2)
+            self._desc_boxed = tuple(
+                _format_with_boxes(list(self._desc_lines_raw), avail_w)
+            )
+            if self._desc_entry is not None:
+                self._desc_entry[1] = self._desc_boxed
+        return self._desc_boxed
+
+    @property
+    def _desc_lines(self) -> tuple[str, ...]:
+        """Formatted with boxes (full-screen desc view)."""
+        return self._ensure_desc_lines()
+
+    def check_resize(self) -> bool:
+        resized = super().check_resize()
+        if resized:
+            self._on_resize()
+        return resized
+
+    def _on_resize(self) -> None:
+        """Re-wrap the description if the terminal width changed."""
+        if self._loading or self._detail is None:
+            return
+        if self.term.width == self._desc_render_width:
+            return
+        self._build_description()
+        if self._view_mode == "desc":
+            content_height = max(1, self.term.height - 4)
+            max_scroll = max(0, len(self._ensure_desc_lines()) - content_height)
+            self._desc_scroll = min(self._desc_scroll, max_scroll)
 
     def _load_code(self) -> str:
+        """Return the solution text for the current language.
+
+        Disk is only read the first time a language is visited; after that
+        the in-memory copy (kept current by _save_code) is used.
+        """
         if not self._detail:
             return ""
+        cached = self._code_cache.get(self._lang_slug)
+        if cached is not None:
+            return cached
         path = get_solution_path(self._title_slug, self._lang_slug)
         if path.exists():
-            return path.read_text(encoding="utf-8")
-        snippet = self._detail.get_snippet(self._lang_slug)
-        return snippet.code if snippet else ""
+            code = path.read_text(encoding="utf-8")
+        else:
+            snippet = self._detail.get_snippet(self._lang_slug)
+            code = snippet.code if snippet else ""
+        self._code_cache[self._lang_slug] = code
+        return code
 
     def _save_code(self) -> None:
         if not self._dirty or self._editor is None:
             return
         self._dirty = False
         code = self._editor.get_text()
+        self._code_cache[self._lang_slug] = code
         path = get_solution_path(self._title_slug, self._lang_slug)
         path.write_text(code, encoding="utf-8")
 
@@ -326,13 +466,13 @@ class ProblemDetailScreen(Screen):
 
         # Row 1: Meta (difficulty + tags) - write each part separately
         diff = detail.difficulty
-        diff_color = {"Easy": "green", "Medium": "yellow", "Hard": "red"}.get(diff, "")
+        diff_color = _DIFF_COLOR.get(diff, "")
         tags = ", ".join(detail.topic_tags[:5]) if detail.topic_tags else ""
 
         clear_line(t, 1)
-        sys.stdout.write(t.move_xy(0, 1) + fmt(t, diff_color, diff))
+        sys.stdout.write(move(t, 0, 1) + fmt(t, diff_color, diff))
         if tags:
-            sys.stdout.write(t.move_xy(len(diff) + 2, 1) + fmt(t, "dim", truncate(tags, w - len(diff) - 2)))
+            sys.stdout.write(move(t, len(diff) + 2, 1) + fmt(t, "dim", truncate(tags, w - len(diff) - 2)))
 
         # Row 2: Divider
         write_row(t, 2, "-" * w, "dim")
@@ -342,70 +482,26 @@ class ProblemDetailScreen(Screen):
 
         if self._view_mode == "desc":
             # ── Description mode: full screen for description ──
-            total_desc = len(self._desc_lines)
-            desc_height = content_height
-            visible_lines = self._desc_lines[self._desc_scroll: self._desc_scroll + desc_height]
-            for i in range(desc_height):
-                row_y = 3 + i
-                clear_line(t, row_y)
-                if i < len(visible_lines):
-                    write_at(t, 1, row_y, truncate(visible_lines[i], w - 2))
-
-            # Scroll hint if content overflows
-            has_more = (self._desc_scroll + desc_height) < total_desc or self._desc_scroll > 0
-            if has_more:
-                remaining = total_desc - self._desc_scroll - desc_height
-                if remaining > 0:
-                    hint = f"[scroll: ^up/^dn, {remaining} more]"
-                else:
-                    hint = "[scroll: ^up/^dn]"
-                hint_x = max(0, w - len(hint) - 1)
-                write_at(t, hint_x, 3 + desc_height - 1, fmt(t, "dim", hint))
+            self._ensure_desc_lines()
+            for i in range(content_height):
+                self._render_desc_row(i, content_height)
 
         elif self._view_mode == "split":
             # ── Split mode: description left ~40%, editor right ~60% ──
             desc_w = w * 2 // 5
             editor_w = w - desc_w - 1  # 1 col for │ divider
 
-            # Re-wrap raw description lines to fit in the narrower pane
-            desc_text_w = max(10, desc_w - 2)  # 1 col left margin + 1 col right pad
-            split_desc = _rewrap_lines(self._desc_lines_raw, desc_text_w)
-
             # Description pane (left)
-            total_desc = len(split_desc)
-            visible_lines = split_desc[self._desc_scroll: self._desc_scroll + content_height]
-            for i in range(content_height):
-                row_y = 3 + i
-                if i < len(visible_lines):
-                    line_text = truncate(visible_lines[i], desc_text_w)
-                    # Write left margin + text + padding up to divider
-                    padded = " " + line_text
-                    padding = desc_w - len(padded)
-                    if padding > 0:
-                        padded += " " * padding
-                    sys.stdout.write(t.move_xy(0, row_y) + padded)
-                else:
-                    sys.stdout.write(t.move_xy(0, row_y) + " " * desc_w)
-                # Draw divider
-                sys.stdout.write(fmt(t, "dim", "│"))
-
-            # Scroll hint for description pane
-            has_more = (self._desc_scroll + content_height) < total_desc or self._desc_scroll > 0
-            if has_more:
-                remaining = total_desc - self._desc_scroll - content_height
-                if remaining > 0:
-                    hint = f"[{remaining} more]"
-                else:
-                    hint = "[scroll]"
-                hint_x = max(0, desc_w - len(hint) - 1)
-                write_at(t, hint_x, 3 + content_height - 1, fmt(t, "dim", hint))
+            if self._dirty_desc:
+                self._render_split_desc(desc_w, content_height)
 
             # Editor pane (right) - language header + code
-            lang = SLUG_TO_LANGUAGE.get(self._lang_slug, self._lang_slug)
-            hdr_text = f"--- {lang.lower()} " + "-" * max(0, editor_w - len(lang) - 5)
-            write_at(t, desc_w + 1, 3, fmt(t, "dim", truncate(hdr_text, editor_w)))
-            if self._editor and content_height > 1:
-                self._editor.render(desc_w + 1, 4, editor_w, content_height - 1)
+            if self._dirty_editor:
+                lang = SLUG_TO_LANGUAGE.get(self._lang_slug, self._lang_slug)
+                hdr_text = f"--- {lang.lower()} " + "-" * max(0, editor_w - len(lang) - 5)
+                write_at(t, desc_w + 1, 3, fmt(t, "dim", truncate(hdr_text, editor_w)))
+                if self._editor and content_height > 1:
+                    self._editor.render(desc_w + 1, 4, editor_w, content_height - 1)
 
         else:
             # ── Editor mode: full screen for code editor ──
@@ -424,13 +520,108 @@ class ProblemDetailScreen(Screen):
             write_row(t, status_row, notif, "dim", fill=True)
         else:
             if self._view_mode == "desc":
-                status = "^d split view  arrows scroll  esc back"
+                status = _STATUS_DESC
             elif self._view_mode == "split":
-                status = "^t test  ^s submit  ^l lang  ^d editor  ^u/^r undo/redo  c-up/dn scroll  esc back"
+                status = _STATUS_SPLIT
             else:
-                status = "^t test  ^s submit  ^l lang  ^d description  ^u/^r undo/redo  esc back"
+                status = _STATUS_EDITOR
             write_row(t, status_row, status, "dim", fill=True)
 
+        self._dirty_desc = False
+        self._dirty_editor = False
+        flush()
+
+    def _render_split_desc(self, desc_w: int, content_height: int) -> None:
+        """Paint the split view's description pane and its divider column."""
+        t = self.term
+        # Re-wrap raw description lines to fit in the narrower pane
+        desc_text_w = max(10, desc_w - 2)  # 1 col left margin + 1 col right pad
+        split_desc = self._split_desc_lines(desc_text_w)
+
+        total_desc = len(split_desc)
+        visible_lines = split_desc[self._desc_scroll: self._desc_scroll + content_height]
+        # Build every left-pane row (margin + text, padded up to the
+        # divider) first, then emit them all in one write.
+        left_rows = [
+            (" " + truncate(line, desc_text_w)).ljust(desc_w)
+            for line in visible_lines
+        ]
+        left_rows.extend([" " * desc_w] * (content_height - len(left_rows)))
+        divider = fmt(t, "dim", "│")
+        sys.stdout.write("".join([
+            move(t, 0, 3 + i) + row + divider
+            for i, row in enumerate(left_rows)
+        ]))
+
+        # Scroll hint for description pane
+        has_more = (self._desc_scroll + content_height) < total_desc or self._desc_scroll > 0
+        if has_more:
+            remaining = total_desc - self._desc_scroll - content_height
+            if remaining > 0:
+                hint = f"[{remaining} more]"
+            else:
+                hint = "[scroll]"
+            hint_x = max(0, desc_w - len(hint) - 1)
+            write_at(t, hint_x, 3 + content_height - 1, fmt(t, "dim", hint))
+
+    def _render_desc_row(self, i: int, desc_height: int) -> None:
+        """Paint row i of the full-screen description pane."""
+        t = self.term
+        w = t.width
+        row_y = 3 + i
+        clear_line(t, row_y)
+        lines = self._ensure_desc_lines()
+        idx = self._desc_scroll + i
+        if idx < len(lines):
+            write_at(t, 1, row_y, truncate(lines[idx], w - 2))
+
+        # Scroll hint on the last row if content overflows
+        if i != desc_height - 1:
+            return
+        total_desc = len(lines)
+        has_more = (self._desc_scroll + desc_height) < total_desc or self._desc_scroll > 0
+        if has_more:
+            remaining = total_desc - self._desc_scroll - desc_height
+            if remaining > 0:
+                hint = f"[scroll: ^up/^dn, {remaining} more]"
+            else:
+                hint = "[scroll: ^up/^dn]"
+            hint_x = max(0, w - len(hint) - 1)
+            write_at(t, hint_x, row_y, fmt(t, "dim", hint))
+
+    def _scroll_desc_pane(self, dy: int) -> None:
+        """Shift the description pane by one line with a terminal scroll region.
+
+        The terminal moves the existing rows itself, so only the newly
+        exposed row and the hint row get repainted. Falls back to a full
+        render if one is already pending or the terminal lacks csr/il1/dl1.
+        """
+        if self.dirty:
+            return
+        t = self.term
+        desc_height = max(1, t.height - 4)
+        top = 3
+        bottom = top + desc_height - 1
+        try:
+            region = t.csr(top, bottom)
+            shift = t.dl1 if dy > 0 else t.il1
+            reset = t.csr(0, t.height - 1)
+        except (AttributeError, TypeError):
+            region = shift = reset = ""
+        if not (region and shift and reset):
+            self.invalidate()
+            return
+
+        sys.stdout.write(region + move(t, 0, top) + shift + reset)
+        if dy > 0:
+            # Old hint row moved up one; new line exposed at the bottom
+            rows = (desc_height - 2, desc_height - 1)
+        else:
+            # New line exposed at the top; bottom row needs the hint
+            rows = (0, desc_height - 1)
+        for i in rows:
+            if i >= 0:
+                self._render_desc_row(i, desc_height)
         flush()
 
     # ── Key handling ──────────────────────────────────────────────────
@@ -455,6 +646,8 @@ class ProblemDetailScreen(Screen):
         if key == "\x04":
             cycle = {"desc": "split", "split": "editor", "editor": "desc"}
             self._view_mode = cycle[self._view_mode]
+            if self._view_mode == "desc":
+                self._ensure_desc_lines()
             self.invalidate()
             return
 
@@ -464,77 +657,69 @@ class ProblemDetailScreen(Screen):
             await self.app.pop_screen()
             return
 
-        if self._view_mode == "desc":
-            # Description mode: arrow keys scroll
-            if key.name in ("kUP5", "kUP3", "KEY_UP"):
-                if self._desc_scroll > 0:
-                    self._desc_scroll -= 1
-                    self.invalidate()
-                return
-            if key.name in ("kDN5", "kDN3", "KEY_DOWN"):
-                content_height = max(1, self.term.height - 4)
-                max_scroll = max(0, len(self._desc_lines) - content_height)
-                if self._desc_scroll < max_scroll:
-                    self._desc_scroll += 1
-                    self.invalidate()
-                return
-            if key.name == "KEY_PGUP":
-                content_height = max(1, self.term.height - 4)
-                self._desc_scroll = max(0, self._desc_scroll - content_height)
-                self.invalidate()
-                return
-            if key.name == "KEY_PGDOWN":
-                content_height = max(1, self.term.height - 4)
-                max_scroll = max(0, len(self._desc_lines) - content_height)
-                self._desc_scroll = min(max_scroll, self._desc_scroll + content_height)
-                self.invalidate()
-                return
+        handler = self._scroll_keys[self._view_mode].get(key.name)
+        if handler is not None:
+            handler()
+            return
 
-        elif self._view_mode == "split":
-            # Split mode: Ctrl+Up/Down scroll description, everything else → editor
-            if key.name in ("kUP5", "kUP3"):
-                if self._desc_scroll > 0:
-                    self._desc_scroll -= 1
-                    self.invalidate()
-                return
-            if key.name in ("kDN5", "kDN3"):
-                content_height = max(1, self.term.height - 4)
-                desc_w = self.term.width * 2 // 5
-                desc_text_w = max(10, desc_w - 2)
-                split_lines = _rewrap_lines(self._desc_lines_raw, desc_text_w)
-                max_scroll = max(0, len(split_lines) - content_height)
-                if self._desc_scroll < max_scroll:
-                    self._desc_scroll += 1
-                    self.invalidate()
-                return
-            if key.name == "KEY_PGUP":
-                content_height = max(1, self.term.height - 4)
-                self._desc_scroll = max(0, self._desc_scroll - content_height)
-                self.invalidate()
-                return
-            if key.name == "KEY_PGDOWN":
-                content_height = max(1, self.term.height - 4)
-                desc_w = self.term.width * 2 // 5
-                desc_text_w = max(10, desc_w - 2)
-                split_lines = _rewrap_lines(self._desc_lines_raw, desc_text_w)
-                max_scroll = max(0, len(split_lines) - content_height)
-                self._desc_scroll = min(max_scroll, self._desc_scroll + content_height)
-                self.invalidate()
-                return
-            # All other keys (arrows, shift+arrows, typing, etc.) → editor
-            if self._editor:
-                consumed = self._editor.handle_key(key)
-                if consumed:
-                    self._dirty = True
-                    self.invalidate()
+        # Split and editor modes: everything else → editor
+        if self._view_mode != "desc" and self._editor:
+            consumed = self._editor.handle_key(key)
+            if consumed:
+                self._dirty = True
+                self._invalidate_editor()
+
+    # ── Description scrolling ─────────────────────────────────────────
+
+    def _desc_line_up(self) -> None:
+        if self._desc_scroll > 0:
+            self._desc_scroll -= 1
+            self._scroll_desc_pane(-1)
+
+    def _desc_line_down(self) -> None:
+        content_height = max(1, self.term.height - 4)
+        max_scroll = max(0, len(self._desc_lines) - content_height)
+        if self._desc_scroll < max_scroll:
+            self._desc_scroll += 1
+            self._scroll_desc_pane(1)
+
+    def _desc_page_up(self) -> None:
+        content_height = max(1, self.term.height - 4)
+        self._desc_scroll = max(0, self._desc_scroll - content_height)
+        self.invalidate()
 
-        else:
-            # Editor mode: pass keys to editor
-            if self._editor:
-                consumed = self._editor.handle_key(key)
-                if consumed:
-                    self._dirty = True
-                    self.invalidate()
+    def _desc_page_down(self) -> None:
+        content_height = max(1, self.term.height - 4)
+        max_scroll = max(0, len(self._desc_lines) - content_height)
+        self._desc_scroll = min(max_scroll, self._desc_scroll + content_height)
+        self.invalidate()
+
+    def _split_max_scroll(self, content_height: int) -> int:
+        desc_w = self.term.width * 2 // 5
+        desc_text_w = max(10, desc_w - 2)
+        return max(0, len(self._split_desc_lines(desc_text_w)) - content_height)
+
+    def _split_line_up(self) -> None:
+        if self._desc_scroll > 0:
+            self._desc_scroll -= 1
+            self._invalidate_desc()
+
+    def _split_line_down(self) -> None:
+        content_height = max(1, self.term.height - 4)
+        if self._desc_scroll < self._split_max_scroll(content_height):
+            self._desc_scroll += 1
+            self._invalidate_desc()
+
+    def _split_page_up(self) -> None:
+        content_height = max(1, self.term.height - 4)
+        self._desc_scroll = max(0, self._desc_scroll - content_height)
+        self._invalidate_desc()
+
+    def _split_page_down(self) -> None:
+        content_height = max(1, self.term.height - 4)
+        max_scroll = self._split_max_scroll(content_height)
+        self._desc_scroll = min(max_scroll, self._desc_scroll + content_height)
+        self._invalidate_desc()
 
     # ── Actions ───────────────────────────────────────────────────────
 
@@ -611,6 +796,7 @@ class ProblemDetailScreen(Screen):
             await self.app.pop_screen()
 
     def _action_next_lang(self) -> None:
+        # Only the editor changes here; description state is left untouched.
         if not self._detail or not self._detail.code_snippets:
             return
         self._save_code()
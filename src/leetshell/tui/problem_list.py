@@ -1,13 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import sys
 
 from leetshell.api.client import AuthenticationError
 from leetshell.models.problem import ProblemSummary
 from leetshell.tui.core import (
-    Screen, write_at, clear_screen, clear_line, pad_right, truncate,
-    write_row, fmt, flush,
+    FrameBuffer, Screen, pad_right, paint, paint_cells,
 )
 
 
@@ -22,6 +20,8 @@ _DIFF_DISPLAY = {"": "All", "EASY": "Easy", "MEDIUM": "Medium", "HARD": "Hard"}
 _DIFF_COLOR = {"Easy": "green", "Medium": "yellow", "Hard": "red"}
 _STATUS_ICON = {"ac": "v", "notac": "x"}
 _STATUS_COLOR = {"ac": "green", "notac": "yellow"}
+_PREFETCH_MARGIN = 5  # rows from the page end at which the next page is fetched
+_HINTS = "j/k scroll  pgdn/pgup page  / search  d difficulty  r refresh  enter open  L logout  esc quit"
 
 
 class ProblemListScreen(Screen):
@@ -31,22 +31,47 @@ class ProblemListScreen(Screen):
         self._total = 0
         self._skip = 0
         self._limit = 50
+        self._page = 1  # kept in step with _skip/_total by _update_page_info
+        self._total_pages = 1
         self._difficulty = ""
+        self._difficulty_idx = 0  # position of _difficulty in _DIFF_CYCLE
         self._search = ""
         self._cursor = 0
         self._scroll = 0  # first visible problem index
         self._loading = True
+        self._loaded = asyncio.Event()  # set when the current fetch finishes
         self._searching = False
-        self._search_buffer = ""
+        self._search_buffer: list[str] = []  # characters typed so far
+        self._header_w = -1  # width _header_line was built for
+        self._header_line = ""
+        self._shadow: dict[int, str] = {}  # row y -> content last written there
+        self._rendered_rows: list[str] = []  # unselected row per problem
+        self._rendered_w = -1  # width _rendered_rows was built for
+        self._fetch_task: asyncio.Task | None = None
+        # Next page fetched ahead of PgDown, keyed by (skip, difficulty, search)
+        self._next_page_key: tuple[int, str, str] | None = None
+        self._next_page_cache: tuple[list[ProblemSummary], int] | None = None
+        self._prefetch_task: asyncio.Task | None = None
 
     async def on_enter(self) -> None:
+        self._shadow.clear()  # the app cleared the screen
         self.invalidate()
         if not self._problems:
             self._loading = True
-            asyncio.create_task(self._fetch_problems())
+            self._start_fetch()
 
     # ── Data fetching ────────────────────────────────────────────────
 
+    def _start_fetch(self) -> None:
+        """Fetch the current page, cancelling any fetch still in flight."""
+        if self._fetch_task and not self._fetch_task.done():
+            self._fetch_task.cancel()
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        self._update_page_info()
+        self._loaded.clear()
+        self._fetch_task = asyncio.create_task(self._fetch_problems())
+
     async def _fetch_problems(self) -> None:
         self._loading = True
         self.invalidate()
@@ -57,20 +82,79 @@ class ProblemListScreen(Screen):
                 difficulty=self._difficulty,
                 search=self._search,
             )
-            self._problems = problems
-            self._total = total
-            self._loading = False
-            self._cursor = 0
-            self._scroll = 0
-            self.invalidate()
+            self._show_page(problems, total)
+        except asyncio.CancelledError:
+            # Superseded by a newer fetch; leave state to that one
+            raise
         except AuthenticationError:
             self._loading = False
+            self._loaded.set()
             self.app.show_login_on_auth_error()
         except Exception as e:
             self._loading = False
+            self._loaded.set()
             self.app.notify(f"Error: {e}")
             self.invalidate()
 
+    def _show_page(self, problems: list[ProblemSummary], total: int) -> None:
+        self._problems = problems
+        self._rebuild_rows()
+        self._total = total
+        self._update_page_info()
+        self._loading = False
+        self._cursor = 0
+        self._scroll = 0
+        self._loaded.set()
+        self.invalidate()
+
+    def _maybe_prefetch(self) -> None:
+        """Start fetching the next page once the cursor nears the page end."""
+        if self._loading or self._cursor < len(self._problems) - _PREFETCH_MARGIN:
+            return
+        skip = self._skip + self._limit
+        if skip >= self._total:
+            return
+        page_key = (skip, self._difficulty, self._search)
+        if self._next_page_key == page_key and self._next_page_cache is not None:
+            return
+        if self._prefetch_task and not self._prefetch_task.done():
+            return
+        self._prefetch_task = asyncio.create_task(self._prefetch(page_key))
+
+    async def _prefetch(self, page_key: tuple[int, str, str]) -> None:
+        skip, difficulty, search = page_key
+        try:
+            result = await self.app.problem_service.get_problem_list(
+                limit=self._limit,
+                skip=skip,
+                difficulty=difficulty,
+                search=search,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Speculative; PgDown falls back to a normal fetch and reports errors
+            return
+        self._next_page_key = page_key
+        self._next_page_cache = result
+
+    def _clear_prefetch(self) -> None:
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        self._next_page_key = None
+        self._next_page_cache = None
+
+    def _update_page_info(self) -> None:
+        """Recompute the page numbers shown in the status bar."""
+        self._page = self._skip // self._limit + 1
+        self._total_pages = max(1, (self._total + self._limit - 1) // self._limit)
+
+    def check_resize(self) -> bool:
+        resized = super().check_resize()
+        if resized:
+            self._shadow.clear()
+        return resized
+
     # ── Scroll helpers ────────────────────────────────────────────────
 
     def _visible_rows(self) -> int:
@@ -91,29 +175,34 @@ class ProblemListScreen(Screen):
         t = self.term
         w = t.width
         h = t.height
+        # Rows whose content matches the shadow from the last frame are skipped
+        buf = FrameBuffer(self._shadow)
 
         # Row 0: Filter bar
         if self._searching:
-            filter_text = "Search: " + self._search_buffer
-            cursor_char = fmt(t, "reverse", " ")
+            filter_text = "Search: " + "".join(self._search_buffer)
+            cursor_char = paint(t, "reverse", " ")
             filter_display = pad_right(filter_text, w - 1)
-            sys.stdout.write(t.move_xy(0, 0) + filter_display + cursor_char)
+            buf.put_row(t, 0, filter_display + cursor_char)
         else:
             diff_display = _DIFF_DISPLAY[self._difficulty]
             search_display = f'  "{self._search}"' if self._search else ""
             filter_text = f" Difficulty: {diff_display}{search_display}"
-            write_row(t, 0, filter_text, "reverse", fill=True)
+            buf.put_row(t, 0, paint(t, "reverse", pad_right(filter_text, w)))
 
         if self._loading:
             for row_y in range(1, h):
-                clear_line(t, row_y)
-            write_at(t, w // 2 - 5, h // 2, fmt(t, "dim", "loading..."))
-            flush()
+                if row_y == h // 2:
+                    buf.put_row(t, row_y, t.clear_eol + " " * max(0, w // 2 - 5)
+                                + paint(t, "dim", "loading..."))
+                else:
+                    buf.put_row(t, row_y, t.clear_eol)
+            buf.flush()
             return
 
         # Row 1: Table header
         col_title_w = max(w - COL_STATUS - COL_ID - COL_DIFF - COL_AC, 10)
-        self._render_header(t, 1, w, col_title_w)
+        buf.put_row(t, 1, self._format_header(t, w, col_title_w))
 
         # Rows 2..(h-2): Table body with scroll
         body_start = 2
@@ -122,81 +211,93 @@ class ProblemListScreen(Screen):
 
         self._ensure_cursor_visible()
 
-        for i in range(visible):
+        if self._rendered_w != w:
+            self._rebuild_rows()
+        rows = self._rendered_rows
+
+        # Rows past the content; the shadow skips those that are already blank
+        drawn = max(0, min(visible, len(rows) - self._scroll))
+        for i in range(drawn, visible):
+            buf.put_row(t, body_start + i, t.clear_eol)
+
+        for i in range(drawn):
             problem_idx = self._scroll + i
             row_y = body_start + i
-            if problem_idx >= len(self._problems):
-                clear_line(t, row_y)
-                continue
-            self._render_row(t, row_y, self._problems[problem_idx], col_title_w, w,
-                             is_selected=(problem_idx == self._cursor))
+            if problem_idx == self._cursor:
+                buf.put_row(t, row_y, self._format_row(
+                    t, self._problems[problem_idx], col_title_w, w, is_selected=True,
+                ))
+            else:
+                buf.put_row(t, row_y, rows[problem_idx])
 
         # Bottom status bar
-        page = self._skip // self._limit + 1
-        total_pages = max(1, (self._total + self._limit - 1) // self._limit)
-        info = f" {len(self._problems)} of {self._total}  pg {page}/{total_pages}"
+        info = f" {len(self._problems)} of {self._total}  pg {self._page}/{self._total_pages}"
         if self._difficulty:
             info += f"  [{self._difficulty.lower()}]"
         if self._search:
             info += f'  "{self._search}"'
-        hints = "j/k scroll  pgdn/pgup page  / search  d difficulty  r refresh  enter open  L logout  esc quit"
-        status_line = info + "  |  " + hints
-        write_row(t, h - 1, status_line, "dim", fill=True)
-        flush()
-
-    def _render_header(self, t, y: int, w: int, col_title_w: int) -> None:
-        x = 0
-        sys.stdout.write(t.move_xy(0, y) + t.clear_eol)
-        sys.stdout.write(t.move_xy(x, y) + fmt(t, "bold", pad_right(" ", COL_STATUS)))
-        x += COL_STATUS
-        sys.stdout.write(t.move_xy(x, y) + fmt(t, "bold", pad_right("#", COL_ID)))
-        x += COL_ID
-        sys.stdout.write(t.move_xy(x, y) + fmt(t, "bold", pad_right("Title", col_title_w)))
-        x += col_title_w
-        sys.stdout.write(t.move_xy(x, y) + fmt(t, "bold", pad_right("Difficulty", COL_DIFF)))
-        x += COL_DIFF
-        sys.stdout.write(t.move_xy(x, y) + fmt(t, "bold", pad_right("AC%", COL_AC)))
-
-    def _render_row(self, t, y: int, p: ProblemSummary, col_title_w: int,
-                    w: int, is_selected: bool) -> None:
+        status_line = f"{info}  |  {_HINTS}"
+        buf.put_row(t, h - 1, paint(t, "dim", pad_right(status_line, w)))
+        buf.flush()
+
+    def _rebuild_rows(self) -> None:
+        """Format every loaded problem's unselected row for the current width."""
+        t = self.term
+        w = t.width
+        col_title_w = max(w - COL_STATUS - COL_ID - COL_DIFF - COL_AC, 10)
+        self._rendered_rows = [
+            self._format_row(t, p, col_title_w, w, is_selected=False)
+            for p in self._problems
+        ]
+        self._rendered_w = w
+
+    def _format_header(self, t, w: int, col_title_w: int) -> str:
+        if self._header_w != w:
+            # Header text only depends on the width; build it once per width.
+            self._header_line = t.clear_eol + paint(t, "bold", (
+                " " * COL_STATUS
+                + "#".ljust(COL_ID)
+                + "Title".ljust(col_title_w)
+                + "Difficulty".ljust(COL_DIFF)
+                + "AC%".ljust(COL_AC)
+            ))
+            self._header_w = w
+        return self._header_line
+
+    def _format_row(self, t, p: ProblemSummary, col_title_w: int, w: int,
+                    is_selected: bool) -> str:
+        # Format specs pad (and clip) each column in one step; ".N" keeps
+        # an unexpectedly long id/difficulty from shifting later columns.
+        # Inlined truncate(): col_title_w >= 10, so only the "..." case applies
+        title = p.title
+        if len(title) >= col_title_w:
+            title = title[:col_title_w - 4] + "..."
+        ac = f"{p.ac_rate:.1f}%"
         if is_selected:
             status_icon = "$" if p.paid_only else _STATUS_ICON.get(p.status, " ")
             plain_line = (
-                pad_right(status_icon, COL_STATUS)
-                + pad_right(p.frontend_id, COL_ID)
-                + pad_right(truncate(p.title, col_title_w - 1), col_title_w)
-                + pad_right(p.difficulty, COL_DIFF)
-                + pad_right(f"{p.ac_rate:.1f}%", COL_AC)
-            )
-            sys.stdout.write(
-                t.move_xy(0, y) + fmt(t, "reverse", pad_right(plain_line, w))
+                f"{status_icon:<{COL_STATUS}}{p.frontend_id:<{COL_ID}.{COL_ID}}"
+                f"{title:<{col_title_w}}{p.difficulty:<{COL_DIFF}.{COL_DIFF}}"
+                f"{ac:<{COL_AC}}"
             )
-            return
-
-        x = 0
-        sys.stdout.write(t.move_xy(0, y) + t.clear_eol)
+            return paint(t, "reverse", plain_line[:w].ljust(w))
 
         # Status icon
         if p.paid_only:
-            sys.stdout.write(t.move_xy(x, y) + pad_right("$", COL_STATUS))
-        elif p.status in _STATUS_COLOR:
-            icon = _STATUS_ICON[p.status]
-            sys.stdout.write(t.move_xy(x, y) + fmt(t, _STATUS_COLOR[p.status], icon) + " " * (COL_STATUS - 1))
+            status_color, icon = "", "$"
         else:
-            sys.stdout.write(t.move_xy(x, y) + " " * COL_STATUS)
-        x += COL_STATUS
-
-        sys.stdout.write(t.move_xy(x, y) + pad_right(p.frontend_id, COL_ID))
-        x += COL_ID
-
-        sys.stdout.write(t.move_xy(x, y) + pad_right(truncate(p.title, col_title_w - 1), col_title_w))
-        x += col_title_w
-
-        diff_color = _DIFF_COLOR.get(p.difficulty, "")
-        sys.stdout.write(t.move_xy(x, y) + fmt(t, diff_color, pad_right(p.difficulty, COL_DIFF)))
-        x += COL_DIFF
-
-        sys.stdout.write(t.move_xy(x, y) + pad_right(f"{p.ac_rate:.1f}%", COL_AC))
+            status_color, icon = _STATUS_COLOR.get(p.status, ""), _STATUS_ICON.get(p.status, "")
+
+        # Columns are fixed-width, so the terminal's own cursor advance
+        # lines them up; only one cursor move per row is needed. Cells are
+        # painted with SGR changes only where the color actually changes.
+        return t.clear_eol + paint_cells(t, [
+            (status_color, icon),
+            ("", " " * (COL_STATUS - len(icon))
+                 + f"{p.frontend_id:<{COL_ID}.{COL_ID}}{title:<{col_title_w}}"),
+            (_DIFF_COLOR.get(p.difficulty, ""), f"{p.difficulty:<{COL_DIFF}.{COL_DIFF}}"),
+            ("", f"{ac:<{COL_AC}}"),
+        ])
 
     # ── Key handling ──────────────────────────────────────────────────
 
@@ -207,17 +308,17 @@ class ProblemListScreen(Screen):
                 self._searching = False
                 self.invalidate()
             elif key.name == "KEY_ENTER":
-                self._search = self._search_buffer
+                self._search = "".join(self._search_buffer)
                 self._searching = False
                 self._skip = 0
-                asyncio.create_task(self._fetch_problems())
+                self._start_fetch()
             elif key.name == "KEY_BACKSPACE" or key.name == "KEY_DELETE":
                 if self._search_buffer:
-                    self._search_buffer = self._search_buffer[:-1]
-                    self.invalidate()
+                    self._search_buffer.pop()
+                    self.schedule_invalidate()
             elif key and not key.is_sequence:
-                self._search_buffer += key
-                self.invalidate()
+                self._search_buffer.append(str(key))
+                self.schedule_invalidate()
             return
 
         # Normal mode
@@ -225,6 +326,7 @@ class ProblemListScreen(Screen):
             if self._problems and self._cursor < len(self._problems) - 1:
                 self._cursor += 1
                 self.invalidate()
+                self._maybe_prefetch()
         elif key == "k" or key.name == "KEY_UP":
             if self._cursor > 0:
                 self._cursor -= 1
@@ -232,23 +334,36 @@ class ProblemListScreen(Screen):
         elif key.name == "KEY_PGDOWN":
             if self._skip + self._limit < self._total:
                 self._skip += self._limit
-                asyncio.create_task(self._fetch_problems())
+                page_key = (self._skip, self._difficulty, self._search)
+                if self._next_page_key == page_key and self._next_page_cache is not None:
+                    # Already prefetched: swap it in without a round trip
+                    problems, total = self._next_page_cache
+                    self._next_page_key = None
+                    self._next_page_cache = None
+                    if self._fetch_task and not self._fetch_task.done():
+                        self._fetch_task.cancel()
+                    self._show_page(problems, total)
+                else:
+                    self._start_fetch()
         elif key.name == "KEY_PGUP":
             if self._skip > 0:
                 self._skip = max(0, self._skip - self._limit)
-                asyncio.create_task(self._fetch_problems())
+                self._start_fetch()
         elif key == "/":
             self._searching = True
-            self._search_buffer = self._search
+            self._search_buffer = list(self._search)
+            self._clear_prefetch()
             self.invalidate()
         elif key == "d":
-            idx = (_DIFF_CYCLE.index(self._difficulty) + 1) % len(_DIFF_CYCLE)
-            self._difficulty = _DIFF_CYCLE[idx]
+            self._difficulty_idx = (self._difficulty_idx + 1) % len(_DIFF_CYCLE)
+            self._difficulty = _DIFF_CYCLE[self._difficulty_idx]
             self._skip = 0
-            asyncio.create_task(self._fetch_problems())
+            self._clear_prefetch()
+            self._start_fetch()
         elif key == "r":
             self._skip = 0
-            asyncio.create_task(self._fetch_problems())
+            self._clear_prefetch()
+            self._start_fetch()
         elif key.name == "KEY_ENTER":
             await self._open_problem()
         elif key == "L":
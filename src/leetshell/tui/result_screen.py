@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from leetshell.tui.core import (
+    FrameBuffer, LinesView, Screen, pad_right, truncate, paint,
+)
+
+
+class ResultScreen(Screen):
+    """Scrollable page of (color, text) lines under a title and a hint bar.
+
+    Subclasses set _TITLE and _HINTS, fill self._lines, and handle their
+    own action keys before deferring to handle_key() here for scrolling.
+    """
+
+    _TITLE = ""
+    _HINTS = ""
+
+    on_dismiss = None  # callback: async (action: str | None) -> None
+
+    def __init__(self, app) -> None:
+        super().__init__(app)
+        self._lines = LinesView()  # (color, text) pairs
+        self._scroll = 0
+        self._shadow: dict[int, str] = {}  # row y -> content last written there
+        self._rows: list[str | None] = []  # _lines truncated + colored for _rows_w
+        self._rows_w = -1
+        self._last_h = self.term.height  # height at last render, for scroll clamps
+
+    def render(self) -> None:
+        t = self.term
+        w = t.width
+        h = t.height
+        self._last_h = h
+        # Rows whose content matches the shadow from the last frame are skipped
+        buf = FrameBuffer(self._shadow)
+
+        # Title
+        # EL goes before the text: after a full-width row it would erase the
+        # last column from the terminal's pending-wrap position
+        buf.put_row(t, 0, t.clear_eol + paint(t, "bold", self._TITLE))
+        buf.put_row(t, 1, t.clear_eol)
+
+        # Scrollable content
+        body_start = 2
+        body_end = h - 2
+        visible = body_end - body_start
+
+        if self._rows_w != w:
+            # Rows are truncated/coloured on first display at each width
+            self._rows = [None] * len(self._lines)
+            self._rows_w = w
+        rows = self._rows
+
+        # Rows past the content; the shadow skips those that are already blank
+        drawn = max(0, min(visible, len(rows) - self._scroll))
+        for i in range(drawn, visible):
+            buf.put_row(t, body_start + i, t.clear_eol)
+
+        for i in range(drawn):
+            idx = self._scroll + i
+            row = rows[idx]
+            if row is None:
+                color, text = self._lines[idx]
+                row = rows[idx] = t.clear_eol + paint(t, color, truncate(text, w))
+            buf.put_row(t, body_start + i, row)
+        if body_end >= body_start:
+            buf.put_row(t, body_end, t.clear_eol)
+
+        # Status bar
+        buf.put_row(t, h - 1, paint(t, "dim", pad_right(self._HINTS, w)))
+        buf.flush()
+
+    def check_resize(self) -> bool:
+        resized = super().check_resize()
+        if resized:
+            self._shadow.clear()
+        return resized
+
+    async def on_enter(self) -> None:
+        self._shadow.clear()  # the app cleared the screen
+        self.invalidate()
+
+    async def handle_key(self, key) -> None:
+        if key == "j" or key.name == "KEY_DOWN":
+            max_scroll = max(0, len(self._lines) - (self._last_h - 4))
+            if self._scroll < max_scroll:
+                self._scroll += 1
+                self.invalidate()
+        elif key == "k" or key.name == "KEY_UP":
+            if self._scroll > 0:
+                self._scroll -= 1
+                self.invalidate()
+        elif key.name == "KEY_PGDOWN":
+            max_scroll = max(0, len(self._lines) - (self._last_h - 4))
+            self._scroll = min(max_scroll, self._scroll + 20)
+            self.invalidate()
+        elif key.name == "KEY_PGUP":
+            self._scroll = max(0, self._scroll - 20)
+            self.invalidate()
+
+    async def _dismiss(self, action: str | None) -> None:
+        callback = self.on_dismiss
+        await self.app.pop_screen()
+        if callback:
+            await callback(action)
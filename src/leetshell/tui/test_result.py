@@ -1,20 +1,17 @@
 from __future__ import annotations
 
 from leetshell.models.submission import TestResult
-from leetshell.tui.core import (
-    Screen, write_at, clear_screen, clear_line, pad_right, truncate, fmt, flush,
-)
+from leetshell.tui.result_screen import ResultScreen
 
 
-class TestResultScreen(Screen):
-    on_dismiss = None  # callback: async (action: str | None) -> None
+class TestResultScreen(ResultScreen):
+    _TITLE = "Test Results"
+    _HINTS = "[s] submit  [e] edit  [esc] back  [j/k] scroll"
 
     def __init__(self, app, result: TestResult, title_slug: str) -> None:
         super().__init__(app)
         self._result = result
         self._title_slug = title_slug
-        self._lines: list[tuple[str, str]] = []  # (color, text) pairs
-        self._scroll = 0
         self._build_lines()
 
     def _build_lines(self) -> None:
@@ -33,14 +30,12 @@ class TestResultScreen(Screen):
 
         if r.compile_error:
             lines.append(("red", "Compile Error:"))
-            for line in r.compile_error.split("\n"):
-                lines.append(("red", "  " + line))
+            lines.extend_block("red", "  ", r.compile_error.split("\n"))
             lines.append(("", ""))
 
         if r.runtime_error:
             lines.append(("red", "Runtime Error:"))
-            for line in r.runtime_error.split("\n"):
-                lines.append(("red", "  " + line))
+            lines.extend_block("red", "  ", r.runtime_error.split("\n"))
             lines.append(("", ""))
 
         for i, tc in enumerate(r.test_cases):
@@ -56,36 +51,6 @@ class TestResultScreen(Screen):
         if r.runtime:
             lines.append(("dim", f"runtime: {r.runtime}  memory: {r.memory}"))
 
-    def render(self) -> None:
-        t = self.term
-        clear_screen(t)
-        w = t.width
-        h = t.height
-
-        # Title
-        write_at(t, 0, 0, fmt(t, "bold", "Test Results"))
-
-        # Scrollable content
-        body_start = 2
-        body_end = h - 2
-        visible = body_end - body_start
-
-        for i in range(visible):
-            idx = self._scroll + i
-            row_y = body_start + i
-            if idx >= len(self._lines):
-                clear_line(t, row_y)
-                continue
-
-            color, text = self._lines[idx]
-            display = truncate(text, w)
-            write_at(t, 0, row_y, fmt(t, color, display))
-
-        # Status bar
-        hints = "[s] submit  [e] edit  [esc] back  [j/k] scroll"
-        write_at(t, 0, h - 1, fmt(t, "dim", pad_right(hints, w)))
-        flush()
-
     async def handle_key(self, key) -> None:
         if key == "s":
             await self._dismiss("submit")
@@ -93,25 +58,5 @@ class TestResultScreen(Screen):
             await self._dismiss("edit")
         elif key.name == "KEY_ESCAPE":
             await self._dismiss(None)
-        elif key == "j" or key.name == "KEY_DOWN":
-            max_scroll = max(0, len(self._lines) - (self.term.height - 4))
-            if self._scroll < max_scroll:
-                self._scroll += 1
-                self.invalidate()
-        elif key == "k" or key.name == "KEY_UP":
-            if self._scroll > 0:
-                self._scroll -= 1
-                self.invalidate()
-        elif key.name == "KEY_PGDOWN":
-            max_scroll = max(0, len(self._lines) - (self.term.height - 4))
-            self._scroll = min(max_scroll, self._scroll + 20)
-            self.invalidate()
-        elif key.name == "KEY_PGUP":
-            self._scroll = max(0, self._scroll - 20)
-            self.invalidate()
-
-    async def _dismiss(self, action: str | None) -> None:
-        callback = self.on_dismiss
-        await self.app.pop_screen()
-        if callback:
-            await callback(action)
+        else:
+            await super().handle_key(key)
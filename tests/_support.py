@@ -0,0 +1,130 @@
+"""Helpers shared by the standalone test scripts in this directory."""
+
+import asyncio
+import os
+import re
+import sys
+from itertools import groupby
+
+
+ANSI = re.compile(r'\x1b\[[0-9;?]*[a-zA-Z]')
+MOVE = re.compile(r'\x1b\[(\d+);(\d+)H')
+
+
+# ── Test terminal colors ──────────────────────────────────────────
+
+# SGR code per test-terminal color method
+_SGR_CODES = {
+    "bold": 1, "dim": 2, "reverse": 7,
+    "green": 32, "yellow": 33, "red": 31, "cyan": 36,
+    "magenta": 35, "blue": 34, "white": 37,
+    "bright_black": 90, "bright_green": 92, "bright_red": 91, "bright_cyan": 96,
+}
+
+
+def _sgr_method(name, code):
+    prefix = f"\x1b[{code}m"
+
+    def method(self, t):
+        return prefix + t + "\x1b[0m"
+
+    method.__name__ = name
+    return method
+
+
+def add_color_methods(cls):
+    """Class decorator: give a test terminal bold(), green(), ... methods."""
+    for name, code in _SGR_CODES.items():
+        setattr(cls, name, _sgr_method(name, code))
+    return cls
+
+
+# ── Rendered output parsing ───────────────────────────────────────
+
+def strip(t):
+    if "\x1b" not in t:
+        return t
+    return ANSI.sub("", t)
+
+
+def parse_rows(buf):
+    rows = {}
+    cr, cc = 0, 0
+    pos = 0
+    for m in MOVE.finditer(buf):
+        t = strip(buf[pos:m.start()])
+        if t:
+            rows.setdefault(cr, []).append((cc, t))
+        r, c = m.groups()
+        cr, cc = int(r) - 1, int(c) - 1
+        pos = m.end()
+    t = strip(buf[pos:])
+    if t:
+        rows.setdefault(cr, []).append((cc, t))
+    return rows
+
+
+def row_text(rows, r):
+    return "".join([t for _, t in rows.get(r, ())])
+
+
+def all_text(rows):
+    return "".join([t for r in sorted(rows) for _, t in rows[r]])
+
+
+def max_blank_run(lines):
+    """Length of the longest run of blank (whitespace-only) lines."""
+    return max(
+        (sum(1 for _ in run) for blank, run in groupby(lines, key=lambda l: not l.strip()) if blank),
+        default=0,
+    )
+
+
+# ── Capture and async helpers ─────────────────────────────────────
+
+class _Capture:
+    """Minimal stdout stand-in: collects writes in a list."""
+    __slots__ = ("parts", "write")
+
+    def __init__(self):
+        self.parts = []
+        self.write = self.parts.append
+
+    def flush(self):
+        pass
+
+
+def capture(fn):
+    cap = _Capture()
+    old = sys.stdout
+    sys.stdout = cap
+    try:
+        fn()
+    finally:
+        sys.stdout = old
+    return "".join(cap.parts)
+
+
+async def wait_loaded(screen, timeout):
+    """Wait up to timeout seconds for a screen's data fetch to finish."""
+    loaded = getattr(screen, "_loaded", None)
+    if loaded is None:
+        return
+    try:
+        await asyncio.wait_for(loaded.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+def run(coro):
+    """Run a script's main() coroutine, on uvloop when it is available."""
+    # uvloop is optional (and unavailable on Windows); asyncio works the same.
+    # Profilers see through asyncio's Python frames but not uvloop's, so
+    # LEETSHELL_PROFILE keeps the default loop.
+    runner = asyncio.run
+    if not os.environ.get("LEETSHELL_PROFILE"):
+        try:
+            from uvloop import run as runner
+        except ImportError:
+            pass
+    return runner(coro)
@@ -1,18 +1,21 @@
 """End-to-end test: open multiple problems at multiple terminal sizes."""
 
-import asyncio
-import io
+import os
 import re
 import sys
 import time
 
-ANSI = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
-MOVE = re.compile(r'\x1b\[(\d+);(\d+)H')
+from _support import (
+    ANSI, add_color_methods, all_text, capture, max_blank_run, parse_rows,
+    row_text, run, wait_loaded,
+)
 
 PASS = 0
 FAIL = 0
+VERBOSE = bool(os.environ.get("VERBOSE"))  # also log passing checks
 
 
+@add_color_methods
 class TT:
     """Test terminal with configurable size and safe formatting."""
 
@@ -46,116 +49,73 @@ class TT:
     def clear_eol(self):
         return "\x1b[K"
 
-    def _w2(self, c, t):
-        return f"\x1b[{c}m{t}\x1b[0m"
-
-    def bold(self, t):
-        return self._w2(1, t)
-
-    def dim(self, t):
-        return self._w2(2, t)
-
-    def reverse(self, t):
-        return self._w2(7, t)
-
-    def green(self, t):
-        return self._w2(32, t)
-
-    def yellow(self, t):
-        return self._w2(33, t)
-
-    def red(self, t):
-        return self._w2(31, t)
-
-    def cyan(self, t):
-        return self._w2(36, t)
-
-    def magenta(self, t):
-        return self._w2(35, t)
-
-    def blue(self, t):
-        return self._w2(34, t)
-
-    def white(self, t):
-        return self._w2(37, t)
-
-    def bright_black(self, t):
-        return self._w2(90, t)
-
-    def bright_green(self, t):
-        return self._w2(92, t)
-
-    def bright_red(self, t):
-        return self._w2(91, t)
-
-    def bright_cyan(self, t):
-        return self._w2(96, t)
-
     def length(self, t):
+        if "\x1b" not in t:
+            return len(t)
         return len(ANSI.sub("", t))
 
 
-def strip(t):
-    return ANSI.sub("", t)
-
+_TT_POOL = {}  # (w, h) -> TT; TT holds no state besides its size
 
-def parse_rows(buf):
-    rows = {}
-    segments = []
-    pos = 0
-    for m in MOVE.finditer(buf):
-        if pos < m.start():
-            segments.append(("t", buf[pos : m.start()]))
-        segments.append(("m", int(m.group(1)) - 1, int(m.group(2)) - 1))
-        pos = m.end()
-    if pos < len(buf):
-        segments.append(("t", buf[pos:]))
-    cr, cc = 0, 0
-    for s in segments:
-        if s[0] == "m":
-            cr, cc = s[1], s[2]
-        else:
-            t = strip(s[1])
-            if t:
-                rows.setdefault(cr, []).append((cc, t))
-    return rows
 
-
-def row_text(rows, r):
-    if r not in rows:
-        return ""
-    return "".join(t for _, t in rows[r])
-
-
-def all_text(rows):
-    return "".join(row_text(rows, r) for r in sorted(rows))
+def make_term(w, h):
+    term = _TT_POOL.get((w, h))
+    if term is None:
+        term = _TT_POOL[(w, h)] = TT(w, h)
+    return term
 
 
 def check(label, cond, detail=""):
     global PASS, FAIL
     if cond:
         PASS += 1
-        print(f"    [PASS] {label}")
+        if VERBOSE:
+            print(f"    [PASS] {label}")
     else:
         FAIL += 1
         print(f"    [FAIL] {label} -- {detail}")
 
 
-def capture(fn):
-    buf = io.StringIO()
-    old = sys.stdout
-    sys.stdout = buf
-    try:
-        fn()
-    finally:
-        sys.stdout = old
-    return buf.getvalue()
+def summary(since):
+    """Print the pass/fail counts since a (PASS, FAIL) snapshot."""
+    print(f"    [PASS] {PASS - since[0]} / FAIL {FAIL - since[1]}")
+
+
+def test_plaintext():
+    """Check the LeetCode HTML renderer on the tags descriptions use."""
+    from leetshell.tui.leetcode_html import to_plaintext
+
+    print("\n  --- HTML to plain text ---")
+    since = (PASS, FAIL)
+    cases = [
+        ("Unordered list", "<ul><li>one</li><li>two</li></ul>", ["- one", "- two"]),
+        ("Ordered list", "<ol><li>one</li><li>two</li></ol>", ["1. one", "2. two"]),
+        ("Paragraph in list item",
+         "<ul>\n<li>\n<p>Alpha beta</p>\n</li></ul>", ["- Alpha beta"]),
+        ("Pre keeps line breaks",
+         "<p>Input:</p><pre>a = 1\n  b = 2</pre>", ["Input:", "", "    a = 1", "      b = 2"]),
+        ("Sup and sub", "<p>2<sup>31</sup> x<sub>i</sub></p>", ["2^31 x_i"]),
+        ("Inline code", "<p>Use <code>nums</code>.</p>", ["Use `nums`."]),
+        ("Table rows",
+         "<table><tr><th>k</th><th>v</th></tr><tr><td>a</td><td>b</td></tr></table>",
+         ["k | v", "a | b"]),
+        ("Line break", "<p>first<br>second<br/>third</p>", ["first", "second", "third"]),
+    ]
+    for label, html, want in cases:
+        got = to_plaintext(html, 40)
+        check(label, got == want, f"{got!r} != {want!r}")
+    wrapped = to_plaintext("<p>" + "word " * 30 + "</p>", 20)
+    check("Wraps to width", max(map(len, wrapped)) <= 20 and len(wrapped) > 1,
+          f"{wrapped!r}")
+    summary(since)
 
 
 async def main():
     from leetshell.app import LeetCodeApp
     from leetshell.tui.problem_detail import ProblemDetailScreen
 
+    test_plaintext()
+
     sizes = [(120, 40), (80, 25), (160, 50)]
 
     problems = [
@@ -171,22 +131,22 @@ async def main():
         print(f"  TERMINAL SIZE: {w}x{h}")
         print(f"{'=' * 70}")
 
-        term = TT(w, h)
+        term = make_term(w, h)
         app = LeetCodeApp()
         app.term = term
         await app._startup()
-        await asyncio.sleep(2)
 
         # ── Problem list ──
         screen = app.current_screen
         if screen:
             screen.term = term
-            await asyncio.sleep(1)
+            await wait_loaded(screen, 3)
 
             rendered = capture(screen.render)
             rows = parse_rows(rendered)
 
             print(f"\n  --- Problem List ({w}x{h}) ---")
+            since = (PASS, FAIL)
             check("Filter bar has Difficulty", "Difficulty" in row_text(rows, 0))
             r1 = row_text(rows, 1)
             check("Header has # Title Diff AC%",
@@ -194,18 +154,21 @@ async def main():
             check("Data rows exist",
                   any(row_text(rows, r).strip() for r in range(2, min(h - 2, 10))))
             check("Status bar has pg", "pg" in row_text(rows, h - 1))
+            summary(since)
 
         # ── Each problem ──
         for slug, diff, title in problems:
             print(f"\n  --- {title} @ {w}x{h} ---")
+            since = (PASS, FAIL)
 
             detail = ProblemDetailScreen(app, slug)
             detail.term = term
             await app.push_screen(detail)
-            await asyncio.sleep(3)
+            await wait_loaded(detail, 3)
 
             check("Detail loaded", detail._detail is not None)
             if not detail._detail:
+                summary(since)
                 await app.pop_screen()
                 continue
 
@@ -218,19 +181,12 @@ async def main():
             check("No ** markers", not has_bold)
 
             # Lines wrapped to width
-            long = [i for i, l in enumerate(detail._desc_lines) if len(l) > w]
-            check("Desc lines fit width", len(long) == 0,
-                  f"{len(long)} lines > {w} chars")
+            max_len = max(map(len, detail._desc_lines), default=0)
+            check("Desc lines fit width", max_len <= w,
+                  f"max_len={max_len} > {w} chars")
 
             # No consecutive blank lines
-            consec = 0
-            max_consec = 0
-            for l in detail._desc_lines:
-                if not l.strip():
-                    consec += 1
-                    max_consec = max(max_consec, consec)
-                else:
-                    consec = 0
+            max_consec = max_blank_run(detail._desc_lines)
             check("No excessive blanks", max_consec <= 2, f"max={max_consec}")
 
             if detail._editor:
@@ -318,17 +274,17 @@ async def main():
 
             # Editor insert + render (no crash)
             if detail._editor:
+                # _insert_char/_backspace mark the highlight dirty themselves
                 detail._editor._insert_char("x")
-                detail._editor._highlight_dirty = True
                 try:
                     capture(detail.render)
                     check("Edit + render OK", True)
                 except Exception as e:
                     check("Edit + render OK", False, str(e))
                 detail._editor._backspace()
-                detail._editor._highlight_dirty = True
 
             detail._view_mode = "split"
+            summary(since)
 
             await app.pop_screen()
 
@@ -342,4 +298,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())